@@ -1,4 +1,8 @@
 import swisseph as swe
+import threading
+from bisect import bisect_right
+from collections import namedtuple
+from functools import lru_cache, wraps
 from datetime import datetime, timezone, timedelta
 
 # --- Centralized list of planets for consistency ---
@@ -8,14 +12,110 @@ PLANETS = {
     'N. Node': swe.TRUE_NODE
 }
 
+# The Swiss Ephemeris C library keeps global state and is not thread-safe, so every
+# function that calls into it holds this lock. The timeline samples on a worker
+# thread while the GUI thread may compute charts.
+EPHEMERIS_LOCK = threading.RLock()
+
+def _serialized(function):
+    """Runs the decorated function while holding the ephemeris lock."""
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        with EPHEMERIS_LOCK:
+            return function(*args, **kwargs)
+    return wrapper
+
+def _julian_day(calculation_date):
+    """Converts a UTC datetime to a Julian Day (UT)."""
+    return swe.utc_to_jd(calculation_date.year, calculation_date.month, calculation_date.day, calculation_date.hour, calculation_date.minute, calculation_date.second, 1)[1]
+
+@lru_cache(maxsize=4096)
+@_serialized
 def get_planet_position(calculation_date, planet_id):
-    """Calculates the longitude and speed of a single planet for a given UTC datetime."""
-    julian_day_utc = swe.utc_to_jd(calculation_date.year, calculation_date.month, calculation_date.day, calculation_date.hour, calculation_date.minute, calculation_date.second, 1)[1]
+    """
+    Calculates the longitude and speed of a single planet for a given UTC datetime.
+    Results are memoized: the same chart dates are looked up again every time a
+    view is revisited, and the ephemeris is never reconfigured at runtime.
+    """
+    julian_day_utc = _julian_day(calculation_date)
     planet_position_data = swe.calc_ut(julian_day_utc, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
     longitude = planet_position_data[0][0]
     speed = planet_position_data[0][3]
     return longitude, speed
 
+def get_planet_positions(calculation_dates, planets):
+    """
+    Calculates the longitude and speed of several planets over a series of UTC datetimes.
+    'planets' maps names to Swiss Ephemeris ids, like PLANETS. Only the first date
+    goes through a calendar conversion; later Julian Days are offset from it by the
+    elapsed days. Returns one {name: (longitude, speed)} dict per date.
+    The ephemeris lock is taken for one date at a time rather than for the whole
+    series, so a long series on the timeline worker never keeps the GUI thread
+    waiting for more than a single date's calculations.
+    """
+    if not calculation_dates: return []
+    flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+    planet_items = list(planets.items())
+    first_date = calculation_dates[0]
+    with EPHEMERIS_LOCK:
+        first_julian_day = _julian_day(first_date)
+    positions = []
+    for calculation_date in calculation_dates:
+        julian_day_utc = first_julian_day + (calculation_date - first_date).total_seconds() / 86400
+        day_positions = {}
+        with EPHEMERIS_LOCK:
+            for name, planet_id in planet_items:
+                data = swe.calc_ut(julian_day_utc, planet_id, flags)[0]
+                day_positions[name] = (data[0], data[3])
+        positions.append(day_positions)
+    return positions
+
+def get_planet_positions_interpolated(calculation_dates, planets, sample_days):
+    """
+    Like get_planet_positions, for ascending dates, but only samples the ephemeris
+    about every 'sample_days' days and fills in the dates between with cubic
+    Hermite interpolation of the sampled longitudes and speeds. Meant for slow
+    planets: Jupiter to Pluto sampled every 4 days stay within about 1e-3 degrees
+    (a few arcseconds) of the ephemeris, well below display precision. Gaps in the
+    dates longer than 'sample_days' are always sampled on both sides.
+    """
+    if not calculation_dates: return []
+    first_date = calculation_dates[0]
+    days = [(calculation_date - first_date).total_seconds() / 86400 for calculation_date in calculation_dates]
+
+    sample_indices = [0]
+    for i in range(1, len(days)):
+        if days[i] - days[sample_indices[-1]] > sample_days:
+            if i - 1 != sample_indices[-1]:
+                sample_indices.append(i - 1)
+            if days[i] - days[sample_indices[-1]] > sample_days:
+                sample_indices.append(i)
+    if sample_indices[-1] != len(days) - 1:
+        sample_indices.append(len(days) - 1)
+
+    samples = get_planet_positions([calculation_dates[i] for i in sample_indices], planets)
+    positions = [samples[0]]
+    for segment, (start, end) in enumerate(zip(sample_indices, sample_indices[1:])):
+        start_positions, end_positions = samples[segment], samples[segment + 1]
+        span = days[end] - days[start]
+        for i in range(start + 1, end):
+            t = (days[i] - days[start]) / span
+            t2, t3 = t * t, t * t * t
+            day_positions = {}
+            for name, (lon0, speed0) in start_positions.items():
+                lon1, speed1 = end_positions[name]
+                # Unwrap the end longitude so the segment does not jump at 0 degrees.
+                lon1 = lon0 + (lon1 - lon0 + 180) % 360 - 180
+                lon = ((2 * t3 - 3 * t2 + 1) * lon0 + (t3 - 2 * t2 + t) * span * speed0
+                       + (3 * t2 - 2 * t3) * lon1 + (t3 - t2) * span * speed1)
+                speed = ((6 * t2 - 6 * t) * (lon0 - lon1) / span
+                         + (3 * t2 - 4 * t + 1) * speed0 + (3 * t2 - 2 * t) * speed1)
+                day_positions[name] = (lon % 360, speed)
+            positions.append(day_positions)
+        positions.append(end_positions)
+    return positions
+
+@_serialized
 def calculate_natal_chart(birth_date, latitude, longitude, house_system=b'P'):
     """Calculates the natal chart (planets and houses) for a given time and location."""
     chart_planets = {}
@@ -27,53 +127,70 @@ def calculate_natal_chart(birth_date, latitude, longitude, house_system=b'P'):
     chart_houses = houses_raw[0]
     return chart_planets, chart_houses
 
+# Major aspects and their exact angles.
+ASPECT_DEFINITIONS = (
+    ('Conjunction', 0), ('Opposition', 180), ('Trine', 120), ('Square', 90), ('Sextile', 60)
+)
+
+# Every major aspect angle is a multiple of 30 degrees, so a separation can only be
+# within orb (for orbs under 15 degrees) of the multiple of 30 nearest to it. The
+# aspect scans round to that multiple and test a single candidate.
+ASPECTS_BY_30_DEGREE_STEP = {angle // 30: name for name, angle in ASPECT_DEFINITIONS}
+
+# Compact form of an aspect, used where many are kept (e.g. one list per day).
+AspectRecord = namedtuple('AspectRecord', 'name p1 aspect p2 orb')
+
 def calculate_aspects(planets, orb):
-    """Finds aspects between planets within a given orb. Returns list of dicts."""
-    aspects_found = []
-    planet_names = list(planets.keys())
-    aspect_definitions = {'Conjunction': 0, 'Opposition': 180, 'Trine': 120, 'Square': 90, 'Sextile': 60}
+    """Finds aspects between planets within a given orb (under 15 degrees). Returns list of dicts."""
+    return [record._asdict() for record in find_aspect_records(planets, orb)]
 
-    for i in range(len(planet_names)):
-        for j in range(i + 1, len(planet_names)):
-            p1_name = planet_names[i]
-            p2_name = planet_names[j]
-            p1_pos, p1_speed = planets[p1_name]
-            p2_pos, p2_speed = planets[p2_name]
+def find_aspect_records(planets, orb):
+    """Same as calculate_aspects, returning AspectRecord tuples."""
+    aspects_found = []
+    planet_items = get_planet_longitudes(planets)
 
+    for i, (p1_name, p1_pos) in enumerate(planet_items):
+        for p2_name, p2_pos in planet_items[i + 1:]:
             angle = abs(p1_pos - p2_pos)
             if angle > 180: angle = 360 - angle
 
-            for aspect_name, aspect_angle in aspect_definitions.items():
-                current_orb = abs(angle - aspect_angle)
-                if current_orb <= orb:
-                    sorted_planets = sorted([p1_name, p2_name])
-                    aspect_info = {
-                        'p1': sorted_planets[0], 'aspect': aspect_name, 'p2': sorted_planets[1],
-                        'name': f"{sorted_planets[0]} {aspect_name} {sorted_planets[1]}",
-                        'orb': current_orb
-                    }
-                    aspects_found.append(aspect_info)
+            step = round(angle / 30)
+            aspect_name = ASPECTS_BY_30_DEGREE_STEP.get(step)
+            if aspect_name is None: continue
+            current_orb = abs(angle - step * 30)
+            if current_orb <= orb:
+                first, second = (p1_name, p2_name) if p1_name <= p2_name else (p2_name, p1_name)
+                aspects_found.append(AspectRecord(f"{first} {aspect_name} {second}", first, aspect_name, second, current_orb))
     return aspects_found
 
+def get_planet_longitudes(planets):
+    """Returns a list of (name, longitude) pairs for a {name: (longitude, speed)} dict."""
+    return [(name, position[0]) for name, position in planets.items()]
+
 def find_cross_aspects(planets1, planets2, orb):
-    """Finds aspects between two different sets of planets. Returns list of dicts."""
+    """Finds aspects between two different sets of planets within a given orb (under 15 degrees). Returns list of dicts."""
+    records = find_cross_aspect_records(planets1, get_planet_longitudes(planets2), orb)
+    return [record._asdict() for record in records]
+
+def find_cross_aspect_records(planets1, planet_longitudes2, orb):
+    """
+    Same as find_cross_aspects, returning AspectRecord tuples, with the second set
+    already given as (name, longitude) pairs (see get_planet_longitudes). Useful
+    when that set is fixed across many calls.
+    """
     aspects_found = []
-    aspect_definitions = {'Conjunction': 0, 'Opposition': 180, 'Trine': 120, 'Square': 90, 'Sextile': 60}
 
     for p1_name, (p1_pos, p1_speed) in planets1.items():
-        for p2_name, (p2_pos, p2_speed) in planets2.items():
+        for p2_name, p2_pos in planet_longitudes2:
             angle = abs(p1_pos - p2_pos)
             if angle > 180: angle = 360 - angle
 
-            for aspect_name, aspect_angle in aspect_definitions.items():
-                current_orb = abs(angle - aspect_angle)
-                if current_orb <= orb:
-                    aspect_info = {
-                        'p1': p1_name, 'aspect': aspect_name, 'p2': p2_name,
-                        'name': f"{p1_name} {aspect_name} {p2_name}",
-                        'orb': current_orb
-                    }
-                    aspects_found.append(aspect_info)
+            step = round(angle / 30)
+            aspect_name = ASPECTS_BY_30_DEGREE_STEP.get(step)
+            if aspect_name is None: continue
+            current_orb = abs(angle - step * 30)
+            if current_orb <= orb:
+                aspects_found.append(AspectRecord(f"{p1_name} {aspect_name} {p2_name}", p1_name, aspect_name, p2_name, current_orb))
     return aspects_found
 
 # --- NEW PREDICTIVE FUNCTIONS ---
@@ -85,16 +202,26 @@ def calculate_transits(calculation_date):
         transit_planets[name] = get_planet_position(calculation_date, planet_id)
     return transit_planets
 
+def _progression_date(birth_date, target_date):
+    """Returns the ephemeris date whose positions are progressed to the target date."""
+    days_offset = (target_date.date() - birth_date.date()).days
+    return birth_date + timedelta(days=days_offset)
+
 def calculate_secondary_progressions(birth_date, target_date):
     """Calculates secondary progressed planet positions based on the 'day for a year' principle."""
-    days_offset = (target_date.date() - birth_date.date()).days
-    progression_date = birth_date + timedelta(days=days_offset)
+    progression_date = _progression_date(birth_date, target_date)
 
     progressed_planets = {}
     for name, planet_id in PLANETS.items():
         progressed_planets[name] = get_planet_position(progression_date, planet_id)
     return progressed_planets
 
+def calculate_secondary_progressions_series(birth_date, target_dates):
+    """Calculates secondary progressions for a series of target dates in one batch."""
+    progression_dates = [_progression_date(birth_date, target_date) for target_date in target_dates]
+    return get_planet_positions(progression_dates, PLANETS)
+
+@_serialized
 def calculate_solar_arc_progressions(birth_date, target_date):
     """Calculates Solar Arc progressed planet positions."""
     days_offset = (target_date.date() - birth_date.date()).days
@@ -137,6 +264,7 @@ def _find_return_jd(natal_lon, body_id, start_jd):
             break
     return t_jd
 
+@_serialized
 def calculate_solar_return(birth_date, target_year, latitude, longitude, house_system=b'P'):
     """Calculates the Solar Return chart for a given year and location."""
     natal_jd_ut = swe.utc_to_jd(birth_date.year, birth_date.month, birth_date.day, birth_date.hour, birth_date.minute, birth_date.second, 1)[1]
@@ -156,6 +284,7 @@ def calculate_solar_return(birth_date, target_year, latitude, longitude, house_s
     return_planets, return_houses = calculate_natal_chart(return_date, latitude, longitude, house_system=house_system)
     return return_planets, return_houses, return_date
 
+@_serialized
 def calculate_lunar_return(birth_date, target_date, latitude, longitude, house_system=b'P'):
     """Calculates the Lunar Return chart for a given date and location."""
     natal_jd_ut = swe.utc_to_jd(birth_date.year, birth_date.month, birth_date.day, birth_date.hour, birth_date.minute, birth_date.second, 1)[1]
@@ -177,25 +306,35 @@ def calculate_lunar_return(birth_date, target_date, latitude, longitude, house_s
 
 # --- UI HELPER FUNCTIONS ---
 
+ZODIAC_SIGNS = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo", "Libra",
+                "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
+
 def get_zodiac_sign(degree):
     """Returns the zodiac sign for a given degree."""
-    signs = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo", "Libra",
-             "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
-    return signs[int(degree / 30)]
+    return ZODIAC_SIGNS[int(degree / 30)]
 
 def get_zodiac_sign_short(degree):
     """Returns the 3-letter abbreviation for a zodiac sign."""
     return get_zodiac_sign(degree)[:3]
 
-def format_longitude(longitude, show_sign=True):
-    """Formats a decimal degree into a string like '15° Tau 33''."""
-    sign = get_zodiac_sign_short(longitude)
-    deg_in_sign = int(longitude % 30)
-    minutes = int((longitude - (int(longitude) // 30 * 30) - deg_in_sign) * 60)
-    minutes = int((longitude - int(longitude)) * 60)
+def format_longitude(longitude, show_sign=True, pad_minutes=False):
+    """
+    Formats a decimal degree into a string like '15° Tau 33''. With pad_minutes,
+    the minutes of a signed position are always two digits, as on the chart wheel.
+    """
+    # Work in whole arcminutes so the sign, degree and minute come from integer
+    # division, and the formatted strings can be memoized by that.
+    return _format_arcminutes(int(longitude * 60) % (360 * 60), show_sign, pad_minutes)
+
+@lru_cache(maxsize=1024)
+def _format_arcminutes(total_minutes, show_sign, pad_minutes):
+    sign_index, minutes_in_sign = divmod(total_minutes, 30 * 60)
+    deg_in_sign, minutes = divmod(minutes_in_sign, 60)
+    sign = ZODIAC_SIGNS[sign_index][:3]
 
     if show_sign:
-        return f"{deg_in_sign}° {sign} {minutes}'"
+        minutes_text = f"{minutes:02d}" if pad_minutes else str(minutes)
+        return f"{deg_in_sign}° {sign} {minutes_text}'"
     else:
         # The user wants "degrees°minutes'" format, e.g. "15°33'"
         return f"{deg_in_sign}°{minutes:02d}'"
@@ -210,6 +349,23 @@ def get_house_ruler(house_cusp_degree):
     }
     return rulership.get(sign, "Unknown")
 
+def get_house_cusp_offsets(natal_house_cusps):
+    """Returns each of the 12 house cusps as its distance from the first cusp."""
+    start = natal_house_cusps[0]
+    return [(cusp - start) % 360 for cusp in natal_house_cusps[:12]]
+
+def get_house_for_position(position, natal_house_cusps, cusp_offsets=None):
+    """
+    Returns the house (1-12) containing a zodiac position, or 0 without cusps.
+    Measuring from the first cusp makes a single bisection correct for the
+    house that wraps past 0 degrees. Callers doing many lookups can pass the
+    result of get_house_cusp_offsets to avoid rebuilding it.
+    """
+    if not natal_house_cusps: return 0
+    if cusp_offsets is None:
+        cusp_offsets = get_house_cusp_offsets(natal_house_cusps)
+    return bisect_right(cusp_offsets, (position - natal_house_cusps[0]) % 360)
+
 def get_ruled_houses_for_planet(planet_name, natal_house_cusps):
     """
     Finds which natal houses are ruled by a specific planet based on traditional rulerships.
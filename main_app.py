@@ -19,7 +19,7 @@ from time_map_widget import TimeMapWidget
 from astro_engine import (
     calculate_natal_chart, calculate_aspects, calculate_transits,
     calculate_secondary_progressions, calculate_solar_arc_progressions,
-    calculate_solar_return, calculate_lunar_return
+    calculate_solar_return, calculate_lunar_return, EPHEMERIS_LOCK
 )
 
 # --- Global variable to hold the correct font name ---
@@ -600,8 +600,9 @@ class MainWindow(QMainWindow):
             aspects = self.natal_aspects
         
         elif self.current_chart_type == 'predictive':
-            jd_utc = swe.utc_to_jd(self.current_date.year, self.current_date.month, self.current_date.day, self.current_date.hour, self.current_date.minute, self.current_date.second, 1)[1]
-            angles = swe.houses(jd_utc, self.reloc_lat, self.reloc_lon, house_system_code)[1]
+            with EPHEMERIS_LOCK:
+                jd_utc = swe.utc_to_jd(self.current_date.year, self.current_date.month, self.current_date.day, self.current_date.hour, self.current_date.minute, self.current_date.second, 1)[1]
+                angles = swe.houses(jd_utc, self.reloc_lat, self.reloc_lon, house_system_code)[1]
 
             if self.predictive_type == 'transit':
                 self.chart_mode_label.setText("Transits")
@@ -4,8 +4,8 @@ from PyQt6.QtGui import QColor, QFont
 from PyQt6.QtCore import Qt, QDate
 from widgets import StyledButton
 from timeline_grid_widget import TimelineGridWidget
-from astro_engine import calculate_secondary_progressions, calculate_lunar_phase
-from datetime import datetime, timedelta
+from astro_engine import calculate_secondary_progressions, calculate_lunar_phase, get_house_for_position
+from datetime import date, datetime, timedelta
 
 class TimeMapWidget(QWidget):
     """A custom widget to display the 'Time Map' timeline view."""
@@ -71,7 +71,7 @@ class TimeMapWidget(QWidget):
         self.birth_date = None
         self.name = ""
         self.natal_planets = {}
-        self.current_start_date = datetime.now()
+        self.current_start_date = datetime.combine(date.today(), datetime.min.time())
         self.current_timescale_months = 3
 
         main_layout = QVBoxLayout(self)
@@ -168,6 +168,8 @@ class TimeMapWidget(QWidget):
 
     def _handle_timescale_changed(self, months):
         """Handles timescale button clicks."""
+        if months == self.current_timescale_months:
+            return # The requested timescale is already displayed
         self.current_timescale_months = months
         self.update_time_map()
 
@@ -201,11 +203,7 @@ class TimeMapWidget(QWidget):
 
     def _get_house_for_planet(self, planet_pos):
         """Finds the house number for a given planetary degree based on natal houses."""
-        if not self.natal_houses: return 0
-        for i in range(11):
-            if self.natal_houses[i] <= planet_pos < self.natal_houses[i+1]: return i + 1
-        if self.natal_houses[11] <= planet_pos < 360 or 0 <= planet_pos < self.natal_houses[0]: return 12
-        return 0 # Should not happen with valid data
+        return get_house_for_position(planet_pos, self.natal_houses)
 
     def set_chart_data(self, name, birth_date, natal_planets, natal_houses):
         """Receives all chart data, populates header, and passes data down."""
@@ -223,6 +221,8 @@ class TimeMapWidget(QWidget):
 
         # --- Initialize the view ---
         self.date_edit.setDate(QDate.currentDate())
-        self.current_start_date = datetime.now()
+        # Views start at midnight, like dates picked with 'Go', so the same day
+        # always maps to the same timeline cache entry.
+        self.current_start_date = datetime.combine(date.today(), datetime.min.time())
         self.current_timescale_months = 3 # Default to 3 months
         self.update_time_map()
\ No newline at end of file
@@ -1,13 +1,21 @@
+import hashlib
+import heapq
+import math
+import os
+import pickle
+import tempfile
+from array import array
 from datetime import datetime, timedelta
 from PyQt6.QtWidgets import QFrame, QToolTip
 from PyQt6.QtGui import (QFont, QFontMetrics, QColor, QPainter, QPen, QBrush,
-                         QPainterPath)
-from PyQt6.QtCore import Qt, QPointF, QRectF
+                         QPainterPath, QPixmap, QStaticText, QTransform)
+from PyQt6.QtCore import Qt, QLineF, QObject, QPointF, QRectF, QRunnable, QThreadPool, QTimer, pyqtSignal
 from astro_engine import (
-    calculate_secondary_progressions,
-    calculate_aspects, find_cross_aspects,
-    PLANETS, get_planet_position,
-    get_ruled_houses_for_planet, get_zodiac_sign,
+    calculate_secondary_progressions_series,
+    find_aspect_records, find_cross_aspect_records, get_planet_longitudes,
+    PLANETS, get_planet_positions_interpolated,
+    get_house_ruler, get_house_cusp_offsets, get_house_for_position,
+    get_zodiac_sign,
     format_longitude
 )
 
@@ -27,6 +35,187 @@ GLYPH_MAP = {
     '(P)': '\uE530',  # Using a custom character for 'Progressed'
 }
 
+# Event tiers, in the order they are processed.
+TIERS = ('lunar_prog', 'other_prog', 'transits')
+
+# How each tier's row is named in the hover tooltip.
+TIER_LABELS = {
+    'lunar_prog': 'Progressed Moon',
+    'other_prog': 'Progressions',
+    'transits': 'Transits',
+}
+
+# Days whose orb is below this (12 arcminutes) get a tick on progression lines.
+NEAR_EXACT_ORB = 0.2
+
+# Only the slow-moving planets are tracked for the transit tier.
+MAJOR_TRANSIT_PLANETS = {
+    name: PLANETS[name] for name in ('Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto')
+}
+
+# The major transiting planets move smoothly, so the ephemeris is only sampled
+# this many days apart for them and the days between are interpolated.
+TRANSIT_SAMPLE_DAYS = 4
+
+# Daily aspects are persisted here between sessions. Bump the version whenever
+# the calculation changes so stale files are ignored.
+TIMELINE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "timecrisis")
+TIMELINE_CACHE_VERSION = 4
+# Most cache files kept; the least recently used ones are deleted beyond this.
+TIMELINE_CACHE_LIMIT = 48
+
+# Upper bound on the days remembered across views before starting afresh.
+DAY_MEMO_LIMIT = 4000
+
+def _timeline_cache_path(birth_date, natal_planets, start_date, months):
+    """Returns the disk cache file for a chart and view."""
+    key = repr((
+        TIMELINE_CACHE_VERSION, birth_date.isoformat(), start_date.isoformat(),
+        months, sorted(natal_planets.items())
+    ))
+    file_name = hashlib.sha1(key.encode('utf-8')).hexdigest() + ".pickle"
+    return os.path.join(TIMELINE_CACHE_DIR, file_name)
+
+def _load_timeline_cache(path):
+    """Returns the (day dates, daily aspects) stored at path, or None if there is no usable cache."""
+    try:
+        with open(path, 'rb') as f:
+            # The version is stored on its own ahead of the payload, so a stale
+            # file is rejected without unpickling its contents.
+            if pickle.load(f) != TIMELINE_CACHE_VERSION: return None
+            day_dates, aspects_cache = pickle.load(f)
+        # Mark the file as recently used so pruning keeps it.
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # A corrupt or incompatible file is just a cache miss.
+        print(f"WARNING: Ignoring unreadable timeline cache: {e}")
+        return None
+    return day_dates, aspects_cache
+
+def _store_timeline_cache(path, day_dates, aspects_cache):
+    temp_path = None
+    try:
+        os.makedirs(TIMELINE_CACHE_DIR, exist_ok=True)
+        # Write to a uniquely named temporary file first, so a partial write is
+        # never read back and concurrent writers of the same view do not collide.
+        with tempfile.NamedTemporaryFile(dir=TIMELINE_CACHE_DIR, suffix=".tmp", delete=False) as f:
+            temp_path = f.name
+            pickle.dump(TIMELINE_CACHE_VERSION, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump((day_dates, aspects_cache), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+        temp_path = None
+        _prune_timeline_cache()
+    except OSError as e:
+        print(f"WARNING: Could not write timeline cache: {e}")
+    finally:
+        if temp_path is not None:
+            try: os.remove(temp_path)
+            except OSError: pass
+
+def _prune_timeline_cache():
+    """Deletes the least recently used cache files beyond TIMELINE_CACHE_LIMIT."""
+    entries = []
+    for entry in os.scandir(TIMELINE_CACHE_DIR):
+        if entry.name.endswith(".pickle"):
+            try: entries.append((entry.stat().st_mtime, entry.path))
+            except OSError: pass
+    if len(entries) <= TIMELINE_CACHE_LIMIT: return
+    entries.sort(reverse=True)
+    for _, stale_path in entries[TIMELINE_CACHE_LIMIT:]:
+        try: os.remove(stale_path)
+        except OSError: pass
+
+def calculate_timeline_days(birth_date, natal_planets, start_date, months, day_memo):
+    """
+    Calculates the aspects of every sampled day of a view: the progressed
+    aspects (split into lunar and other) and the major transits to the natal
+    chart. The days run from the day before start_date to the day after the
+    last displayed day. Days found in day_memo, a {date: day aspects} dict that
+    is only read, are reused. Returns (day dates, list of per-day aspect dicts).
+    Safe to run off the GUI thread: it only reads its arguments.
+    """
+    cache_path = _timeline_cache_path(birth_date, natal_planets, start_date, months)
+    cached = _load_timeline_cache(cache_path)
+    if cached: return cached
+
+    num_days = months * 30
+
+    # Set the standard orb for progressions to 1.0 degree, as per requirements.
+    prog_orb = 1.0
+
+    day_dates = []
+    one_day = timedelta(days=1)
+    current_date = start_date - one_day
+    for _ in range(num_days + 2):
+        day_dates.append(current_date)
+        current_date += one_day
+
+    # Days already computed for an earlier view of this chart are reused,
+    # so switching timescales only samples the days that are new.
+    computed_days = {}
+    missing_dates = [day for day in day_dates if day not in day_memo]
+
+    # --- Base Planet Calculations ---
+    # Positions for the missing days are sampled up front, one series per
+    # chart type, before any aspects are looked for.
+    transit_series = get_planet_positions_interpolated(missing_dates, MAJOR_TRANSIT_PLANETS, TRANSIT_SAMPLE_DAYS)
+    progressed_series = calculate_secondary_progressions_series(birth_date, missing_dates)
+
+    # Natal positions are the same every day, so they are extracted once.
+    natal_longitudes = get_planet_longitudes(natal_planets)
+    for day, transit_planets, progressed_planets in zip(missing_dates, transit_series, progressed_series):
+        # --- Tier-Specific Aspect Calculations ---
+
+        # 1. Calculate all progressed aspects at once (includes North Node now)
+        all_prog_aspects = find_aspect_records(progressed_planets, prog_orb)
+
+        # 2. Split aspects into their respective tiers in a single pass
+        lunar_prog_aspects, other_prog_aspects = [], []
+        for aspect in all_prog_aspects:
+            if 'Moon' in (aspect.p1, aspect.p2):
+                lunar_prog_aspects.append(aspect)
+            else:
+                other_prog_aspects.append(aspect)
+
+        # 3. Transits (Major transiting planets to all natal planets, including Node)
+        transit_aspects = find_cross_aspect_records(transit_planets, natal_longitudes, 2.0)
+
+        computed_days[day] = {
+            'lunar_prog': lunar_prog_aspects,
+            'other_prog': other_prog_aspects,
+            'transits': transit_aspects,
+            'transit_pos': transit_planets,
+            'progressed_pos': progressed_planets
+        }
+
+    aspects_cache = [computed_days[day] if day in computed_days else day_memo[day] for day in day_dates]
+    _store_timeline_cache(cache_path, day_dates, aspects_cache)
+    return day_dates, aspects_cache
+
+class _TimelineSignals(QObject):
+    # generation, (start date, months), day dates, daily aspects
+    finished = pyqtSignal(int, object, object, object)
+
+class _TimelineTask(QRunnable):
+    """Runs calculate_timeline_days on a pool thread and reports back through a signal."""
+    def __init__(self, generation, signals, birth_date, natal_planets, view, day_memo):
+        super().__init__()
+        self.generation = generation
+        self.signals = signals
+        self.birth_date = birth_date
+        self.natal_planets = natal_planets
+        self.view = view
+        self.day_memo = day_memo
+
+    def run(self):
+        start_date, months = self.view
+        day_dates, aspects_cache = calculate_timeline_days(
+            self.birth_date, self.natal_planets, start_date, months, self.day_memo
+        )
+        self.signals.finished.emit(self.generation, self.view, day_dates, aspects_cache)
+
 class TimelineGridWidget(QFrame):
     """A dedicated widget for drawing the timeline grid and aspect events."""
     def __init__(self, astro_font=None):
@@ -43,7 +232,46 @@ class TimelineGridWidget(QFrame):
         self.natal_planets = {}
         self.natal_houses = []
         self.aspect_events = []
-        self.timeline_aspects_cache = {}
+        # Per-day aspects, indexed like self._day_dates
+        self.timeline_aspects_cache = []
+        # Per-day aspects for the current chart, keyed by date, across views
+        self._day_memo = {}
+        self._day_dates = []
+        self._tier_events = {tier: [] for tier in TIERS}
+        # Events in orb on each day, indexed like self._day_dates
+        self._events_by_day = []
+        # Geometry each tier was last laid out for (see _layout_tier)
+        self._tier_layout_keys = {}
+        self._x_by_day = []
+        self._day_positions_key = None
+
+        # House lookup tables, rebuilt whenever the natal chart changes
+        self._house_offsets = []
+        self._ruled_labels = {}
+        self._natal_house_labels = {}
+
+        # Hover checks are coalesced so fast mouse movement triggers at most
+        # one check per frame, using the most recent cursor position.
+        self._last_hover_pos = None
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(16)
+        self._hover_timer.timeout.connect(self._do_hover_check)
+
+        # View changes arriving in quick succession (e.g. repeated timescale
+        # clicks) are debounced into a single recompute of the latest view.
+        self._pending_view = None
+        # The (start date, months) last sent for calculation
+        self._requested_view = None
+        # Calculations run on a worker thread. Each request bumps the
+        # generation so results for superseded requests can be dropped.
+        self._timeline_generation = 0
+        self._timeline_signals = _TimelineSignals()
+        self._timeline_signals.finished.connect(self._on_timeline_calculated)
+        self._recompute_timer = QTimer(self)
+        self._recompute_timer.setSingleShot(True)
+        self._recompute_timer.setInterval(100)
+        self._recompute_timer.timeout.connect(self._apply_pending_view)
 
         # Theming & Fonts
         self.astro_font = astro_font or QFont("Arial", 14) # Fallback font
@@ -63,101 +291,155 @@ class TimelineGridWidget(QFrame):
             'star': QFont("Titillium Web", 16, QFont.Weight.Bold),
             'glyph': self.astro_font,
         }
+        # Pens and brushes reused by every paint instead of being rebuilt per call
+        self.pens = {
+            'frame': QPen(self.colors['grid'], 1),
+            'lunar': QPen(self.colors['lunar'], 1.5, Qt.PenStyle.SolidLine),
+            'solar': QPen(self.colors['solar'], 1.5, Qt.PenStyle.SolidLine),
+            'transit': QPen(self.colors['transit'], 1),
+            'star': QPen(self.colors['star']),
+        }
+        self.brushes = {
+            'box_bg': QBrush(self.colors['box_bg']),
+        }
+        # Laid-out header and event labels, keyed by (font key, text)
+        self._static_texts = {}
+        # The whole timeline is rendered into a pixmap and blitted on repaint.
+        # It is redrawn when marked dirty or when the size or pixel ratio changes.
+        self._frame_cache = None
+        self._frame_cache_key = None
+        self._frame_dirty = True
+        # Pre-rendered exact-aspect star, as (device pixel ratio, pixmap, ascent)
+        self._star_sprite = None
+        # Arrow from a transit grid up to its date label, relative to the
+        # middle of the grid's top edge. Translated into place for each grid.
+        self._grid_arrow_path = QPainterPath(QPointF(0, 0))
+        self._grid_arrow_path.lineTo(0, -10)
+        self._grid_arrow_path.lineTo(-3, -5)
+        self._grid_arrow_path.moveTo(0, -10)
+        self._grid_arrow_path.lineTo(3, -5)
 
     def set_chart_data(self, birth_date, natal_planets, natal_houses):
+        if (birth_date, natal_planets, list(natal_houses)) == (self.birth_date, self.natal_planets, list(self.natal_houses)):
+            return
         self.birth_date = birth_date
         self.natal_planets = natal_planets
         self.natal_houses = natal_houses
+        self._requested_view = None
+        self._timeline_generation += 1
+        self._day_memo.clear()
+        # The previous chart's events must not be drawn against the new natal
+        # chart while its timeline is calculated.
+        self.aspect_events = []
+        self.timeline_aspects_cache = []
+        self._group_events()
+        self._build_house_tables()
 
-    def set_view(self, start_date, months):
-        self.start_date = start_date
-        self.months_to_display = months
-        self._calculate_and_process_timeline()
-        self.update()
-
-    def _calculate_and_process_timeline(self):
-        if not self.start_date or not self.birth_date:
-            return
-        self._calculate_daily_aspects()
-        self._process_aspect_events()
-
-    def _calculate_daily_aspects(self):
-        if not self.birth_date or not self.natal_planets: return
-        self.timeline_aspects_cache = {}
-        num_days = self.months_to_display * 30
-
-        # Set the standard orb for progressions to 1.0 degree, as per requirements.
-        prog_orb = 1.0
-
-        for i in range(num_days + 2):
-            current_date = self.start_date + timedelta(days=i - 1)
-            date_key = current_date.strftime('%Y-%m-%d')
-
-            # --- Base Planet Calculations ---
-            transit_planets = {name: get_planet_position(current_date, pid) for name, pid in PLANETS.items()}
-            progressed_planets = calculate_secondary_progressions(self.birth_date, current_date)
-
-            # --- Tier-Specific Aspect Calculations ---
+    def _build_house_tables(self):
+        """
+        Precomputes the house lookup tables used by the transit grids.
+        Cusps are stored as offsets from the first cusp so that a house can be
+        found with a single bisection, regardless of where the zodiac wraps.
+        """
+        self._house_offsets = []
+        self._ruled_labels = {}
+        self._natal_house_labels = {}
+        if not self.natal_houses: return
 
-            # 1. Calculate all progressed aspects at once (includes North Node now)
-            all_prog_aspects = calculate_aspects(progressed_planets, prog_orb)
+        cusps = list(self.natal_houses[:12])
+        self._house_offsets = get_house_cusp_offsets(cusps)
 
-            # 2. Filter aspects into their respective tiers
-            lunar_prog_aspects = [
-                a for a in all_prog_aspects if 'Moon' in (a['p1'], a['p2'])
-            ]
-            other_prog_aspects = [
-                a for a in all_prog_aspects if 'Moon' not in (a['p1'], a['p2'])
-            ]
+        ruled_houses = {}
+        for i, cusp in enumerate(cusps):
+            ruled_houses.setdefault(get_house_ruler(cusp), []).append(str(i + 1))
+        self._ruled_labels = {planet: ",".join(houses) for planet, houses in ruled_houses.items()}
 
-            # 3. Transits (Major transiting planets to all natal planets, including Node)
-            major_transits = {p: transit_planets[p] for p in ['Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto']}
-            transit_aspects = find_cross_aspects(major_transits, self.natal_planets, 2.0)
+        # Natal positions never change within a chart, so neither do their houses.
+        self._natal_house_labels = {name: self._get_house_for_position(data[0])
+                                    for name, data in self.natal_planets.items()}
 
-            self.timeline_aspects_cache[date_key] = {
-                'lunar_prog': lunar_prog_aspects,
-                'other_prog': other_prog_aspects,
-                'transits': transit_aspects,
-                'transit_pos': transit_planets,
-                'progressed_pos': progressed_planets
-            }
+    def set_view(self, start_date, months):
+        # The view is only applied once the debounce timer fires, so paints in
+        # between keep drawing the previous, consistent view.
+        self._pending_view = (start_date, months)
+        self._recompute_timer.start()
+
+    def _apply_pending_view(self):
+        if self._pending_view is None: return
+        view, self._pending_view = self._pending_view, None
+        # Re-entering the view that is shown or being calculated needs no recompute.
+        if view == self._requested_view: return
+        self._requested_view = view
+        self._calculate_and_process_timeline(view)
+
+    def _calculate_and_process_timeline(self, view):
+        """
+        Starts calculating the daily aspects for a view on a worker thread. The
+        widget keeps showing the previous view until _on_timeline_calculated
+        receives the result; results for superseded requests are dropped.
+        """
+        if not view[0] or not self.birth_date or not self.natal_planets:
+            return
+        if len(self._day_memo) > DAY_MEMO_LIMIT:
+            self._day_memo.clear()
+
+        self._timeline_generation += 1
+        task = _TimelineTask(
+            self._timeline_generation, self._timeline_signals,
+            self.birth_date, self.natal_planets, view, dict(self._day_memo)
+        )
+        QThreadPool.globalInstance().start(task)
+
+    def _on_timeline_calculated(self, generation, view, day_dates, aspects_cache):
+        if generation != self._timeline_generation: return
+        self.start_date, self.months_to_display = view
+        self._day_dates = day_dates
+        self.timeline_aspects_cache = aspects_cache
+        # Days computed for this view are reused by later views of the chart.
+        self._day_memo.update(zip(day_dates, aspects_cache))
+        self._process_aspect_events()
+        self.update()
 
     def _process_aspect_events(self):
         self.aspect_events = []
-        if not self.timeline_aspects_cache: return
+        if not self.timeline_aspects_cache:
+            # Regroup anyway so no indices or frame from the last result survive.
+            self._group_events()
+            return
         num_days = self.months_to_display * 30
 
+        last_day = num_days + 1
         raw_events = []
-        for tier in ['lunar_prog', 'other_prog', 'transits']:
-            active_aspects = {}
-            for i in range(num_days + 2):
-                current_date = self.start_date + timedelta(days=i - 1)
-                date_key = current_date.strftime('%Y-%m-%d')
-                day_data = self.timeline_aspects_cache.get(date_key, {})
-                todays_aspects = {a['name']: a for a in day_data.get(tier, [])}
-
-                for name, data in todays_aspects.items():
-                    if name not in active_aspects:
-                        active_aspects[name] = {'start': current_date, 'orb_readings': [], 'data': data}
-                    if tier == 'transits':
-                        p1_pos = day_data['transit_pos'][data['p1']][0]
-                        active_aspects[name]['orb_readings'].append((current_date, data['orb'], p1_pos))
-                    else:
-                        active_aspects[name]['orb_readings'].append((current_date, data['orb']))
-
-                ended_names = set(active_aspects.keys()) - set(todays_aspects.keys())
-                for name in ended_names:
-                    event = active_aspects.pop(name)
-                    if not event['orb_readings']: continue
-                    exact_reading = min(event['orb_readings'], key=lambda x: x[1])
-                    final_event = {
-                        'name': name, 'start': event['start'], 'end': current_date, 'tier': tier,
-                        'exact_date': exact_reading[0], 'orb_readings': event['orb_readings'],
-                        'aspect': event['data']['aspect'], 'p1': event['data'].get('p1'), 'p2': event['data'].get('p2')
-                    }
-                    if tier == 'transits' and len(exact_reading) > 2:
-                        final_event['p1_pos_at_exact_pass'] = exact_reading[2]
-                    raw_events.append(final_event)
+        # Each open run knows the last day it was seen. A run is closed
+        # lazily, either when its aspect reappears after a gap or once the
+        # sweep is over, so no per-day set of ended aspects is needed.
+        # All tiers are swept together in a single pass over the days.
+        open_runs_by_tier = {tier: {} for tier in TIERS}
+        for i, day_data in enumerate(self.timeline_aspects_cache):
+            for tier, open_runs in open_runs_by_tier.items():
+                for data in day_data.get(tier, []):
+                    name = data.name
+                    run = open_runs.get(name)
+                    # A run holds one orb per consecutive day from its start,
+                    # so the day after its last reading is start + count.
+                    if run is not None and run['start_day'] + len(run['orbs']) < i:
+                        raw_events.append(self._close_aspect_run(name, run, tier))
+                        run = None
+                    if run is None:
+                        run = open_runs[name] = {'start_day': i, 'orbs': array('d'), 'exact_index': 0, 'exact_pos': None, 'data': data}
+                    orbs, orb = run['orbs'], data.orb
+                    # Track the tightest orb as we go, keeping the earliest on ties.
+                    if not orbs or orb < orbs[run['exact_index']]:
+                        run['exact_index'] = len(orbs)
+                        if tier == 'transits':
+                            run['exact_pos'] = day_data['transit_pos'][data.p1][0]
+                    orbs.append(orb)
+
+        # Runs still active on the final day have not ended inside the view.
+        for tier, open_runs in open_runs_by_tier.items():
+            for name, run in open_runs.items():
+                if run['start_day'] + len(run['orbs']) <= last_day:
+                    raw_events.append(self._close_aspect_run(name, run, tier))
 
         prog_events = [e for e in raw_events if e['tier'] != 'transits']
         transit_events = [e for e in raw_events if e['tier'] == 'transits']
@@ -167,25 +449,83 @@ class TimelineGridWidget(QFrame):
             name = event['name']
             if name not in merged_transits:
                 merged_transits[name] = event
-                merged_transits[name]['exact_dates'] = [event['exact_date']]
+                event['exact_dates'] = [event['exact_date']]
+                event['p1_pos_at_exact'] = event.get('p1_pos_at_exact_pass')
             else:
                 existing = merged_transits[name]
-                existing['start'] = min(existing['start'], event['start'])
-                existing['end'] = max(existing['end'], event['end'])
+                if event['start_day'] < existing['start_day']:
+                    existing['start'], existing['start_day'] = event['start'], event['start_day']
+                if event['end_day'] > existing['end_day']:
+                    existing['end'], existing['end_day'] = event['end'], event['end_day']
                 existing['exact_dates'].append(event['exact_date'])
-                existing['orb_readings'].extend(event['orb_readings'])
+                # The merged event's exact date is the tightest pass overall.
+                if event['exact_orb'] < existing['exact_orb']:
+                    existing['exact_orb'] = event['exact_orb']
+                    existing['exact_date'] = event['exact_date']
+                    existing['exact_day'] = event['exact_day']
+                    existing['p1_pos_at_exact'] = event.get('p1_pos_at_exact_pass')
 
         final_transit_events = []
-        for name, event in merged_transits.items():
-            if not event['orb_readings']: continue
-            most_exact_reading = min(event['orb_readings'], key=lambda x: x[1])
-            event['exact_date'] = most_exact_reading[0]
-            if len(most_exact_reading) > 2:
-                event['p1_pos_at_exact'] = most_exact_reading[2]
+        for event in merged_transits.values():
             event['exact_dates'].sort()
             final_transit_events.append(event)
 
         self.aspect_events = prog_events + final_transit_events
+        self._group_events()
+
+    def _group_events(self):
+        """
+        Groups the events by tier, in the order the layout places them.
+        Progression tiers are ordered by start date; transit grids are centered
+        on their exact date, so that tier is ordered by exact date instead.
+        Also indexes the events by the days they are in orb, for hover lookups.
+        """
+        self._tier_events = {tier: [] for tier in TIERS}
+        self._events_by_day = [[] for _ in self._day_dates]
+        for event in self.aspect_events:
+            self._tier_events[event['tier']].append(event)
+            if event['tier'] != 'transits':
+                for day in range(event['start_day'], event['end_day']):
+                    self._events_by_day[day].append(event)
+
+        # A merged transit spans the gaps between its passes, so it is listed
+        # only on the days its aspect was actually found.
+        transits_by_name = {event['name']: event for event in self._tier_events['transits']}
+        for day, day_data in enumerate(self.timeline_aspects_cache):
+            for data in day_data.get('transits', []):
+                event = transits_by_name.get(data.name)
+                if event is not None:
+                    self._events_by_day[day].append(event)
+
+        self._tier_layout_keys = {}
+        self._frame_dirty = True
+        for tier, events in self._tier_events.items():
+            sort_key = 'exact_day' if tier == 'transits' else 'start_day'
+            events.sort(key=lambda e: e[sort_key])
+
+    def _close_aspect_run(self, name, run, tier):
+        """Turns a finished run of daily aspect readings into an event."""
+        # The event ends on the first day the aspect is out of orb again.
+        orbs, start_day = run['orbs'], run['start_day']
+        end_day, exact_day = start_day + len(orbs), start_day + run['exact_index']
+        final_event = {
+            'name': name, 'tier': tier,
+            'start': self._day_dates[start_day], 'end': self._day_dates[end_day],
+            'exact_date': self._day_dates[exact_day], 'exact_orb': orbs[run['exact_index']],
+            'start_day': start_day, 'end_day': end_day, 'exact_day': exact_day,
+            'aspect': run['data'].aspect, 'p1': run['data'].p1, 'p2': run['data'].p2
+        }
+        if tier == 'transits':
+            # Transit passes are merged by name, so only the exact pass is kept.
+            final_event['p1_pos_at_exact_pass'] = run['exact_pos']
+        else:
+            # The daily orbs, one per day from start_day, and the days that get
+            # a near-exact tick, found once here rather than on every paint.
+            final_event['orbs'] = orbs
+            final_event['near_exact_days'] = array('i', (
+                start_day + k for k, orb in enumerate(orbs) if orb < NEAR_EXACT_ORB
+            ))
+        return final_event
 
     def _get_glyph_label(self, p1, aspect, p2, is_transit=False):
         """Constructs the glyph string for an event."""
@@ -201,42 +541,61 @@ class TimelineGridWidget(QFrame):
             # Progression: P. Planet (P) Aspect P. Planet (P)
             return f"{p1_glyph}{p_glyph} {aspect_glyph} {p2_glyph}{p_glyph}"
 
+    def _layout_tier(self, tier_name, metrics, y_start, lane_height, is_grid=False):
+        """
+        Returns a tier's events laid out for the current geometry. The layout
+        is only redone when the events, the day positions or the tier's
+        vertical placement have changed since the last paint.
+        """
+        key = (self._day_positions_key, y_start, lane_height)
+        if self._tier_layout_keys.get(tier_name) != key:
+            self._perform_layout(self._tier_events[tier_name], metrics, y_start, lane_height, is_grid)
+            self._tier_layout_keys[tier_name] = key
+        return self._tier_events[tier_name]
+
     def _perform_layout(self, events, metrics, y_start, lane_height, is_grid=False):
         """
         A more advanced layout algorithm to prevent overlaps.
         Assigns a 'lane' and a final 'y_pos' to each event.
         This version simplifies the logic by assuming labels are drawn above the event lines,
         not to the left, thus not affecting the horizontal layout calculation.
+        Events must already be in placement order (see _group_events).
+        Each event takes the lowest-numbered lane that is free by its start.
         """
         if not events:
             return []
 
-        sorted_events = sorted(events, key=lambda e: e['start'])
-        lanes = []  # Stores the end time of the last event in each lane
+        sorted_events = events
+        busy_lanes = []  # Heap of (end x, lane) for lanes still occupied
+        free_lanes = []  # Heap of lane numbers that can take the next event
+        lane_count = 0
+        x_by_day = self._x_by_day
 
         for event in sorted_events:
-            event_start_x = self._date_to_x(event['start'])
-            event_end_x = self._date_to_x(event['end'])
+            # Pixel positions are kept on the event for painting.
+            event['start_x'] = event_start_x = x_by_day[event['start_day']]
+            event['end_x'] = event_end_x = x_by_day[event['end_day']]
+            event['exact_x'] = x_by_day[event['exact_day']]
 
             if is_grid:
                 # For grid boxes, the "width" is fixed and centered on the exact date
                 grid_width = 170
-                event_start_x = self._date_to_x(event['exact_date']) - (grid_width / 2)
+                event_start_x = event['exact_x'] - (grid_width / 2)
                 event_end_x = event_start_x + grid_width
 
-            placed = False
-            # Find the first lane where this event can fit without temporal overlap
-            for i, lane_end_x in enumerate(lanes):
-                if event_start_x >= lane_end_x:
-                    lanes[i] = event_end_x
-                    event['lane'] = i
-                    placed = True
-                    break
+            # Events arrive in start order, so a lane that has ended before
+            # this event stays free for every later one too.
+            while busy_lanes and busy_lanes[0][0] <= event_start_x:
+                heapq.heappush(free_lanes, heapq.heappop(busy_lanes)[1])
 
-            if not placed:
+            if free_lanes:
+                lane = heapq.heappop(free_lanes)
+            else:
                 # No free lanes, so create a new one
-                event['lane'] = len(lanes)
-                lanes.append(event_end_x)
+                lane = lane_count
+                lane_count += 1
+            event['lane'] = lane
+            heapq.heappush(busy_lanes, (event_end_x, lane))
 
         # Assign y_pos based on the calculated lane
         for event in sorted_events:
@@ -252,63 +611,106 @@ class TimelineGridWidget(QFrame):
         if not self.start_date or self.months_to_display == 0:
             return
 
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr)
+        if self._frame_dirty or key != self._frame_cache_key:
+            self._frame_cache = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+            self._frame_cache.setDevicePixelRatio(dpr)
+            self._frame_cache.fill(Qt.GlobalColor.transparent)
+            frame_painter = QPainter(self._frame_cache)
+            frame_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self._draw_timeline(frame_painter)
+            frame_painter.end()
+            self._frame_cache_key = key
+            self._frame_dirty = False
+
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPixmap(0, 0, self._frame_cache)
 
+    def _draw_timeline(self, painter):
         self.padding = 20
         self.content_width = self.width() - 2 * self.padding
+        self._update_day_positions()
 
         self._draw_month_header(painter)
 
-        # Define vertical layout parameters
-        lunar_y_start = 110
-        transit_y_start = 250
-        other_prog_y_start = self.height() - 250
-
         # Perform layout and draw each tier
-        self._layout_and_draw_progression_tier(painter, 'lunar_prog', self.colors['lunar'], lunar_y_start)
-        self._layout_and_draw_transit_tier(painter, transit_y_start)
-        self._layout_and_draw_progression_tier(painter, 'other_prog', self.colors['solar'], other_prog_y_start)
+        y_starts = self._tier_y_starts()
+        self._layout_and_draw_progression_tier(painter, 'lunar_prog', self.pens['lunar'], y_starts['lunar_prog'])
+        self._layout_and_draw_transit_tier(painter, y_starts['transits'])
+        self._layout_and_draw_progression_tier(painter, 'other_prog', self.pens['solar'], y_starts['other_prog'])
+
+    def _tier_y_starts(self):
+        """Returns the y position where each tier's row begins."""
+        return {'lunar_prog': 110, 'transits': 250, 'other_prog': self.height() - 250}
+
+    def _tier_at_y(self, y):
+        """Returns the tier whose row contains a y position, or None above the first row."""
+        tier = None
+        for name, y_start in sorted(self._tier_y_starts().items(), key=lambda item: item[1]):
+            if y >= y_start: tier = name
+        return tier
 
     def _draw_month_header(self, painter):
         header_y, box_height = 40, 30
         year_box_width = 60
         year_rect = QRectF(self.padding, header_y, year_box_width, box_height)
-        self._draw_glow_rect(painter, year_rect, self.colors['grid'])
-        painter.setFont(self.fonts['year'])
+        self._draw_glow_rect(painter, year_rect, self.pens['frame'])
         painter.setPen(self.colors['text'])
-        painter.drawText(year_rect, Qt.AlignmentFlag.AlignCenter, str(self.start_date.year))
+        self._draw_static_text(painter, year_rect, str(self.start_date.year), 'year')
 
         current_year = self.start_date.year
         for i in range(self.months_to_display):
             month_start_date = self.start_date + timedelta(days=i * 30)
-            month_end_date = self.start_date + timedelta(days=(i + 1) * 30)
-            start_x = self._date_to_x(month_start_date)
-            end_x = self._date_to_x(month_end_date)
+            # Day index 0 is the day before start_date.
+            start_x = self._x_by_day[i * 30 + 1]
+            end_x = self._x_by_day[(i + 1) * 30 + 1]
             month_rect = QRectF(start_x, header_y, end_x - start_x, box_height)
-            self._draw_glow_rect(painter, month_rect, self.colors['grid'])
+            self._draw_glow_rect(painter, month_rect, self.pens['frame'])
 
             label = month_start_date.strftime("%b").upper()
             if month_start_date.year != current_year:
                 label = f"{label} {month_start_date.year}"
                 current_year = month_start_date.year
 
-            painter.setFont(self.fonts['month'])
             painter.setPen(self.colors['text'])
-            painter.drawText(month_rect, Qt.AlignmentFlag.AlignCenter, label)
-
-    def _layout_and_draw_progression_tier(self, painter, tier_name, color, y_start):
-        events = [e for e in self.aspect_events if e['tier'] == tier_name]
-
+            self._draw_static_text(painter, month_rect, label, 'month')
+
+    def _get_static_text(self, text, font_key):
+        """Returns the laid-out text for a label, preparing it on first use."""
+        static_text = self._static_texts.get((font_key, text))
+        if static_text is None:
+            static_text = QStaticText(text)
+            static_text.setTextFormat(Qt.TextFormat.PlainText)
+            static_text.prepare(QTransform(), self.fonts[font_key])
+            self._static_texts[(font_key, text)] = static_text
+        return static_text
+
+    def _draw_static_text(self, painter, rect, text, font_key):
+        """Draws a header label centered in a rect, reusing its cached text layout."""
+        static_text = self._get_static_text(text, font_key)
+        size = static_text.size()
+        center = rect.center()
+        painter.setFont(self.fonts[font_key])
+        painter.drawStaticText(QPointF(center.x() - size.width() / 2, center.y() - size.height() / 2), static_text)
+
+    def _layout_and_draw_progression_tier(self, painter, tier_name, line_pen, y_start):
         metrics = QFontMetrics(self.fonts['glyph'])
         # Increase lane height to accommodate labels above the line
         lane_height = metrics.height() + 25
 
-        laid_out_events = self._perform_layout(events, metrics, y_start, lane_height)
+        laid_out_events = self._layout_tier(tier_name, metrics, y_start, lane_height)
+
+        x_by_day = self._x_by_day
+
+        # Labels are drawn as events are visited; lines, ticks and stars are
+        # collected and drawn afterwards, one batch per pen.
+        painter.setFont(self.fonts['glyph'])
+        painter.setPen(self.colors['text'])
+        lines, star_points = [], []
 
         for event in laid_out_events:
-            start_x = self._date_to_x(event['start'])
-            end_x = self._date_to_x(event['end'])
+            start_x, end_x = event['start_x'], event['end_x']
 
             # The Y position from the layout is the top of the lane.
             # The line itself is drawn lower down.
@@ -316,39 +718,38 @@ class TimelineGridWidget(QFrame):
             line_y = lane_top_y + metrics.height() + 5
 
             # 1. Draw the glyph-based label at the top-left of the line's start
+            # The same aspect recurs across the timeline, so labels are laid
+            # out once and drawn from their top-left corner.
             label = self._get_glyph_label(event['p1'], event['aspect'], event['p2'])
-            painter.setFont(self.fonts['glyph'])
-            painter.setPen(self.colors['text'])
-            painter.drawText(QPointF(start_x, lane_top_y + metrics.ascent()), label)
+            painter.drawStaticText(QPointF(start_x, lane_top_y), self._get_static_text(label, 'glyph'))
 
-            # 2. Draw the main aspect line
-            pen = QPen(color, 1.5, Qt.PenStyle.SolidLine)
-            painter.setPen(pen)
-            painter.drawLine(QPointF(start_x, line_y), QPointF(end_x, line_y))
+            # 2. The main aspect line
+            lines.append(QLineF(start_x, line_y, end_x, line_y))
 
-            # 3. Draw arrow indicators for near-exact orbs (12 arcminutes = 0.2 degrees)
-            for orb_reading in event['orb_readings']:
-                orb = orb_reading[1]
-                if orb < 0.2:
-                    arrow_x = self._date_to_x(orb_reading[0])
-                    self._draw_arrow_indicator(painter, QPointF(arrow_x, line_y), color)
+            # 3. Arrow indicators for near-exact orbs
+            for day in event['near_exact_days']:
+                arrow_x = x_by_day[day]
+                lines.append(QLineF(arrow_x, line_y - 4, arrow_x, line_y + 4))
 
-            # 4. Draw the "firework" for the exact aspect
-            exact_x = self._date_to_x(event['exact_date'])
-            self._draw_glow_text(painter, QPointF(exact_x - 4, line_y + 5), "*", self.fonts['star'], self.colors['star'])
+            # 4. The "firework" for the exact aspect
+            exact_x = event['exact_x']
+            star_points.append(QPointF(exact_x - 4, line_y + 5))
 
-    def _layout_and_draw_transit_tier(self, painter, y_start):
-        events = [e for e in self.aspect_events if e['tier'] == 'transits']
+        painter.setPen(line_pen)
+        painter.drawLines(lines)
+        for point in star_points:
+            self._draw_star(painter, point)
 
+    def _layout_and_draw_transit_tier(self, painter, y_start):
         metrics = QFontMetrics(self.fonts['grid']) # Not used for layout here, but for drawing
         grid_height = 85
         lane_height = grid_height + 20 # Spacing between boxes
 
-        laid_out_events = self._perform_layout(events, metrics, y_start, lane_height, is_grid=True)
+        laid_out_events = self._layout_tier('transits', metrics, y_start, lane_height, is_grid=True)
 
         for event in laid_out_events:
             grid_width = 170
-            x_pos = self._date_to_x(event['exact_date']) - (grid_width / 2)
+            x_pos = event['exact_x'] - (grid_width / 2)
             y_pos = event['y_pos']
 
             # Clamp grid position to be within view
@@ -359,8 +760,8 @@ class TimelineGridWidget(QFrame):
             self._draw_single_transit_grid(painter, QRectF(x_pos, y_pos, grid_width, grid_height), event)
 
     def _draw_single_transit_grid(self, painter, rect, event_data):
-        painter.setPen(self.colors['grid'])
-        painter.setBrush(self.colors['box_bg'])
+        painter.setPen(self.pens['frame'])
+        painter.setBrush(self.brushes['box_bg'])
         painter.drawRoundedRect(rect, 5, 5)
 
         p1 = event_data.get('p1') # Transiting planet
@@ -371,10 +772,9 @@ class TimelineGridWidget(QFrame):
         grid_center_x = rect.center().x()
         arrow_start_y = rect.top()
         arrow_end_y = arrow_start_y - 10
-        painter.setPen(QPen(self.colors['transit'], 1))
-        painter.drawLine(QPointF(grid_center_x, arrow_start_y), QPointF(grid_center_x, arrow_end_y))
-        painter.drawLine(QPointF(grid_center_x, arrow_end_y), QPointF(grid_center_x - 3, arrow_end_y + 5))
-        painter.drawLine(QPointF(grid_center_x, arrow_end_y), QPointF(grid_center_x + 3, arrow_end_y + 5))
+        painter.setPen(self.pens['transit'])
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawPath(self._grid_arrow_path.translated(grid_center_x, arrow_start_y))
 
         date_labels = sorted(list(set([d.strftime('%b %d') for d in event_data['exact_dates']])))
         date_str = ", ".join(date_labels)
@@ -396,7 +796,7 @@ class TimelineGridWidget(QFrame):
 
         # Line 2: Natal Planet Position
         natal_pos_str = format_longitude(self.natal_planets[p2][0])
-        natal_house = self._get_natal_house_for_planet(p2)
+        natal_house = self._natal_house_labels.get(p2, "N/A")
         painter.drawText(rect.adjusted(8, 25, -5, -5), Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft, f"Natal: {natal_pos_str} (H{natal_house})")
 
         # Line 3: Transiting Planet Info
@@ -407,53 +807,84 @@ class TimelineGridWidget(QFrame):
             painter.drawText(rect.adjusted(8, 42, -5, -5), Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft, f"In House: {transiting_house}")
 
         # Line 4: Ruled Houses
-        ruled_p1 = get_ruled_houses_for_planet(p1, self.natal_houses)
-        ruled_p2 = get_ruled_houses_for_planet(p2, self.natal_houses)
-        ruled_p1_str = f"{p1}: " + (",".join(ruled_p1) if ruled_p1 else "None")
-        ruled_p2_str = f"{p2}: " + (",".join(ruled_p2) if ruled_p2 else "None")
+        ruled_p1_str = f"{p1}: " + self._ruled_labels.get(p1, "None")
+        ruled_p2_str = f"{p2}: " + self._ruled_labels.get(p2, "None")
         painter.drawText(rect.adjusted(8, 59, -5, -5), Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft, f"Rules: {ruled_p1_str} | {ruled_p2_str}")
 
     # --- Helpers & Utilities ---
 
     def _get_house_for_position(self, position):
-        if not self.natal_houses or position is None: return "N/A"
-        for i in range(11):
-            if self.natal_houses[i] <= position < self.natal_houses[i+1]:
-                return str(i + 1)
-        if self.natal_houses[11] <= position < 360 or 0 <= position < self.natal_houses[0]:
-            return "12"
-        return "N/A"
-
-    def _get_natal_house_for_planet(self, planet_name):
-        if not self.natal_houses or planet_name not in self.natal_planets: return "N/A"
-        planet_pos = self.natal_planets[planet_name][0]
-        return self._get_house_for_position(planet_pos)
-
-    def _date_to_x(self, date):
-        if not self.start_date or self.months_to_display == 0:
-            return self.padding
-        total_days = self.months_to_display * 30
-        days_from_start = (date - self.start_date).total_seconds() / (24 * 3600)
-        proportion = days_from_start / total_days
-        return self.padding + proportion * self.content_width
+        if not self._house_offsets or position is None: return "N/A"
+        return str(get_house_for_position(position, self.natal_houses, self._house_offsets))
+
+    def _day_at_x(self, x):
+        """Returns the index of the sampled day nearest to an x position."""
+        day_width = max(self.content_width, 1) / (self.months_to_display * 30)
+        return round((x - self.padding) / day_width) + 1
 
-    def _draw_arrow_indicator(self, painter, point, color):
-        """Draws a small tick on the timeline to indicate a near-exact orb."""
-        painter.setPen(QPen(color, 1.5))
-        painter.drawLine(QPointF(point.x(), point.y() - 4), QPointF(point.x(), point.y() + 4))
+    def _update_day_positions(self):
+        """
+        Rebuilds the x position of every sampled day. Events refer to days by
+        index, so painting looks positions up instead of converting dates.
+        Only recomputed when the geometry or the displayed range changes.
+        """
+        key = (self.padding, self.content_width, self.months_to_display)
+        if key == self._day_positions_key: return
+        self._day_positions_key = key
 
-    def _draw_glow_rect(self, painter, rect, color):
-        painter.setPen(QPen(color, 1))
+        total_days = self.months_to_display * 30
+        day_width = self.content_width / total_days
+        # Index 0 is the day before start_date, one day left of the padding.
+        self._x_by_day = [self.padding + (i - 1) * day_width for i in range(total_days + 2)]
+
+    def _draw_glow_rect(self, painter, rect, pen):
+        painter.setPen(pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawRoundedRect(rect, 5, 5)
 
-    def _draw_glow_text(self, painter, point, text, font, color):
-        painter.setFont(font)
-        painter.setPen(QPen(color))
-        painter.drawText(point, text)
+    def _draw_star(self, painter, baseline_point):
+        """
+        Draws the exact-aspect star with its baseline at the given point. The
+        glyph is rasterized once per device pixel ratio and then blitted.
+        """
+        dpr = self.devicePixelRatioF()
+        if self._star_sprite is None or self._star_sprite[0] != dpr:
+            metrics = QFontMetrics(self.fonts['star'])
+            # One pixel of slack on each side keeps antialiased edges inside the sprite.
+            pixmap = QPixmap(math.ceil((metrics.horizontalAdvance("*") + 2) * dpr), math.ceil(metrics.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            sprite_painter = QPainter(pixmap)
+            sprite_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            sprite_painter.setFont(self.fonts['star'])
+            sprite_painter.setPen(self.pens['star'])
+            sprite_painter.drawText(QPointF(1, metrics.ascent()), "*")
+            sprite_painter.end()
+            self._star_sprite = (dpr, pixmap, metrics.ascent())
+
+        _, pixmap, ascent = self._star_sprite
+        painter.drawPixmap(QPointF(baseline_point.x() - 1, baseline_point.y() - ascent), pixmap)
 
     def mouseMoveEvent(self, event):
-        # Tooltip logic would need to be updated to work with the new layout.
-        # Disabling for now.
-        QToolTip.hideText()
-        super().mouseMoveEvent(event)
\ No newline at end of file
+        self._last_hover_pos = event.position()
+        if not self._hover_timer.isActive():
+            self._hover_timer.start()
+        super().mouseMoveEvent(event)
+
+    def _do_hover_check(self):
+        """Shows the aspects in orb on the day and in the tier row under the cursor."""
+        pos = self._last_hover_pos
+        if pos is None or not self._events_by_day or self._day_positions_key is None:
+            QToolTip.hideText()
+            return
+        # Only the row under the cursor is listed, so the tooltip matches
+        # the tier the user is pointing at.
+        day, tier = self._day_at_x(pos.x()), self._tier_at_y(pos.y())
+        events = self._events_by_day[day] if tier and 0 < day < len(self._events_by_day) else []
+        events = [event for event in events if event['tier'] == tier]
+        if not events:
+            QToolTip.hideText()
+            return
+        lines = [f"{TIER_LABELS[tier]}, {self._day_dates[day].strftime('%b %d, %Y')}"]
+        lines += [event['name'] for event in events]
+        QToolTip.showText(self.mapToGlobal(pos.toPoint()), "\n".join(lines), self)
\ No newline at end of file
@@ -1,11 +1,46 @@
 import sys
 import os
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import QEvent, QObject, QTimer
 from main_app import MainWindow, load_fonts
 
 app = None
 window = None
+paint_watcher = None
+
+class FirstPaintWatcher(QObject):
+    """Calls back once, right after the watched widget has finished its next paint."""
+    def __init__(self, callback):
+        super().__init__()
+        self.callback = callback
+        self.fired = False
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and not self.fired:
+            self.fired = True
+            # Defer so the paint in progress completes before we grab.
+            QTimer.singleShot(0, self.callback)
+        return False
+
+def on_first_paint():
+    """Drains any remaining queued work, then takes the screenshot."""
+    QApplication.processEvents()
+    check_resize_round_trip()
+    take_screenshot_and_exit()
+
+def check_resize_round_trip():
+    """
+    Resizes the chart away and back to its painted size with no paint in
+    between, then repaints it. The chart must redraw its cached frame even
+    though the final size matches the one it last painted at.
+    """
+    chart = window.chart_area
+    size = chart.size()
+    chart.grab()
+    chart.resize(size.width() + 100, size.height() + 100)
+    chart.resize(size)
+    chart.grab()
+    print("Resize round trip repainted the chart.")
 
 def take_screenshot_and_exit():
     """Grabs the window content and exits the application."""
@@ -36,7 +71,7 @@ def take_screenshot_and_exit():
 
 def setup_and_run_test():
     """Sets up the specific chart state for verification."""
-    global window
+    global window, paint_watcher
     try:
         print("Setting up test case...")
         # 1. Set the natal chart data to the problematic one from the user's report.
@@ -51,15 +86,20 @@ def setup_and_run_test():
         print("Generating natal chart...")
         window.handle_generate_chart()
 
-        # 3. Programmatically switch to the Transit (bi-wheel) view.
+        # 3. Watch the chart for its first paint after the view switch below.
+        # The chart area is watched rather than the window, since a chart
+        # update repaints only that child widget.
+        paint_watcher = FirstPaintWatcher(on_first_paint)
+        window.chart_area.installEventFilter(paint_watcher)
+
+        # 4. Programmatically switch to the Transit (bi-wheel) view.
         # This will trigger the complex layout logic we are testing.
         print("Switching to transit (bi-wheel) view...")
         window.set_chart_type('predictive', 'transit')
 
-        # 4. Use a QTimer to allow the UI to fully render before taking the screenshot.
-        # 3 seconds should be sufficient for all calculations and drawing to complete.
-        print("UI updated. Waiting 3 seconds for rendering to complete...")
-        QTimer.singleShot(3000, take_screenshot_and_exit)
+        # 5. The screenshot is taken as soon as the chart has been repainted.
+        print("UI updated. Waiting for the chart to repaint...")
+        window.chart_area.update()
 
     except Exception as e:
         print(f"CRITICAL: An error occurred during test setup: {e}")
@@ -84,8 +124,8 @@ if __name__ == "__main__":
         window = MainWindow()
         window.show() # Show the window to make it available for grabbing
 
-        # Use a short delay to ensure the window is initialized before we manipulate it.
-        QTimer.singleShot(500, setup_and_run_test)
+        # Run the test as soon as the event loop starts.
+        QTimer.singleShot(0, setup_and_run_test)
 
         sys.exit(app.exec())
 
@@ -1,40 +1,42 @@
 import sys
 import math
 from PyQt6.QtWidgets import QWidget, QLabel, QFormLayout, QVBoxLayout, QFrame, QPushButton, QLineEdit
-from PyQt6.QtGui import QFont, QPainter, QPen, QColor, QBrush, QFontMetrics, QPainterPath, QTransform
+from PyQt6.QtGui import QFont, QPainter, QPen, QColor, QBrush, QFontMetrics, QImage, QPainterPath, QTransform
 from PyQt6.QtCore import Qt, QPointF, QRectF, QRect
 from astro_engine import format_longitude, get_zodiac_sign
 
 class InfoPanel(QWidget):
     """A custom, styled panel for displaying astrological data. Can accept QWidgets."""
+    # The InfoPanel itself is transparent; the QFrame inside provides the styled background and border.
+    _STYLE = """
+        QLabel#panel-title {
+            color: #FF01F9;
+            font-family: "TT Supermolot Neue Condensed";
+            font-size: 14pt;
+            font-weight: bold;
+            padding-bottom: 5px;
+        }
+        QFrame#container {
+            background-color: #200334;
+            border: 1px solid #3DF6FF;
+            border-radius: 5px;
+        }
+        QLabel, QLineEdit {
+            color: #94EBFF;
+            font-family: "Titillium Web";
+            font-size: 10pt;
+            background-color: transparent;
+        }
+        QLineEdit {
+            border: 1px solid #75439E;
+            border-radius: 3px;
+            padding: 2px;
+        }
+    """
+
     def __init__(self, title, data):
         super().__init__()
-        # The InfoPanel itself is transparent; the QFrame inside provides the styled background and border.
-        self.setStyleSheet("""
-            QLabel#panel-title {
-                color: #FF01F9;
-                font-family: "TT Supermolot Neue Condensed";
-                font-size: 14pt;
-                font-weight: bold;
-                padding-bottom: 5px;
-            }
-            QFrame#container {
-                background-color: #200334;
-                border: 1px solid #3DF6FF;
-                border-radius: 5px;
-            }
-            QLabel, QLineEdit {
-                color: #94EBFF;
-                font-family: "Titillium Web";
-                font-size: 10pt;
-                background-color: transparent;
-            }
-            QLineEdit {
-                border: 1px solid #75439E;
-                border-radius: 3px;
-                padding: 2px;
-            }
-        """)
+        self.setStyleSheet(InfoPanel._STYLE)
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -61,31 +63,54 @@ class InfoPanel(QWidget):
 
 class StyledButton(QPushButton):
     """A custom, styled button for the toolbar."""
+    _STYLE = """
+        QPushButton {
+            background-color: #200334;
+            color: #3DF6FF;
+            border: 1px solid #3DF6FF;
+            border-radius: 5px;
+            padding: 10px;
+            font-family: "TT Supermolot Neue Condensed";
+            font-size: 12pt;
+            font-weight: bold;
+        }
+        QPushButton:hover {
+            background-color: #3DF6FF;
+            color: #200334;
+        }
+        QPushButton:pressed {
+            background-color: #94EBFF;
+            color: #200334;
+        }
+    """
+
     def __init__(self, text):
         super().__init__(text)
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #200334;
-                color: #3DF6FF;
-                border: 1px solid #3DF6FF;
-                border-radius: 5px;
-                padding: 10px;
-                font-family: "TT Supermolot Neue Condensed";
-                font-size: 12pt;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #3DF6FF;
-                color: #200334;
-            }
-            QPushButton:pressed {
-                background-color: #94EBFF;
-                color: #200334;
-            }
-        """)
+        self.setStyleSheet(StyledButton._STYLE)
 
 class ChartWidget(QFrame):
     """A custom widget for drawing the astrological chart."""
+    # --- Neon Color Definitions ---
+    NEON_PINK = QColor("#FF01F9")   # Fire
+    NEON_BLUE = QColor("#3DF6FF")   # Water
+    NEON_YELLOW = QColor("#FFFF00") # Air
+    NEON_GREEN = QColor("#39FF14")  # Earth
+    LABEL_COLOR = QColor("#E0D2FF")
+    LINE_COLOR = QColor("#A372FF")
+    # Outer glow layers of _draw_glow_path: rgba(61, 246, 255) at 0.4 and 0.7 alpha
+    _GLOW_COLORS = (QColor(61, 246, 255, int(255 * 0.4)), QColor(61, 246, 255, int(255 * 0.7)))
+
+    _ASPECT_COLORS = {
+        'Trine': QColor(61, 246, 255, 150), 'Sextile': QColor(61, 246, 255, 150),
+        'Square': QColor(255, 1, 249, 150), 'Opposition': QColor(255, 1, 249, 150),
+        'Conjunction': QColor(200, 200, 200, 150)
+    }
+
+    # Unit (cos, sin) pointing at the middle of each sign, before the chart's angle offset
+    _SIGN_MIDPOINTS = tuple(
+        (math.cos(math.radians(i * 30 + 15)), math.sin(math.radians(i * 30 + 15))) for i in range(12)
+    )
+
     def __init__(self, astro_font_name):
         super().__init__()
         self.setMinimumSize(400, 400) # Ensure the widget has a decent size
@@ -100,18 +125,90 @@ class ChartWidget(QFrame):
         self.aspects = []
         self._setup_glyph_data()
 
+        # Fonts are built once; font lookup is not free and the sprite and
+        # text size caches are keyed on them.
+        self.fonts = {
+            'zodiac': QFont(self.astro_font_name, 35),
+            'planet_glyph': QFont(self.astro_font_name, 24),
+            'planet_label': QFont("Titillium Web", 11),
+            'house_number': QFont("Titillium Web", 14),
+            'cusp_label': QFont("Titillium Web", 10),
+        }
+        for key in ('zodiac', 'planet_glyph'):
+            self.fonts[key].setStyleStrategy(QFont.StyleStrategy.NoFontMerging)
+        # One pen per aspect color; aspect types sharing a color share a pen and a path.
+        self._aspect_pens = {}
+        for color in self._ASPECT_COLORS.values():
+            self._aspect_pens.setdefault(color.rgba(), QPen(color, 1.5, Qt.PenStyle.SolidLine))
+        # Drawable aspects as (p1, p2) pairs grouped by color (see set_chart_data)
+        self._aspect_pairs = {}
+        # Unit (cos, sin) from the center to each inner wheel planet, chart offset included
+        self._planet_directions = {}
+        # Planet glyph and label placements per wheel name (see _place_wheel_planets)
+        self._wheel_placements = {}
+        # Pens reused by the glow helpers, which only change their color and width
+        self._glow_pen = QPen(QColor(), 1, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
+        self._text_pen = QPen(QColor(), 1, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
+
+        # Scaffolding and zodiac glyphs rendered off-screen (see _background_image)
+        self._background = None
+        self._background_key = None
+        # The last full frame; the background above is reused across data
+        # changes that keep the same houses and wheels.
+        self._frame = None
+        self._frame_key = None
+        self._frame_dirty = True
+        # Rendered (width, height) of the fixed glyphs, keyed by (font key, text)
+        self._text_sizes = {}
+        # Pre-rendered glowing glyphs, keyed by (text, font key, color, device pixel ratio)
+        self._glyph_sprites = {}
+
     def set_chart_data(self, natal_planets, natal_houses, aspects, outer_planets=None, display_houses=None):
         """
         Sets the data for the chart. The 'outer_planets' parameter is used for the
         second wheel, which could be transits, progressions, etc.
         """
+        if display_houses is None:
+            display_houses = natal_houses
+        new_data = (natal_planets, natal_houses, aspects, outer_planets, display_houses)
+        if new_data == (self.natal_planets, self.house_cusps, self.aspects, self.transit_planets, self.display_houses):
+            return # Nothing to redraw
         self.natal_planets = natal_planets
         self.house_cusps = natal_houses
         self.aspects = aspects
         self.transit_planets = outer_planets
-        self.display_houses = display_houses if display_houses is not None else natal_houses
+        self.display_houses = display_houses
+
+        # Aspect end points only depend on the data, so their directions are found here.
+        angle_offset = 180 - display_houses[0] if display_houses else 180
+        self._planet_directions = {}
+        for name, position in natal_planets.items():
+            angle_rad = math.radians(position[0] + angle_offset)
+            self._planet_directions[name] = (math.cos(angle_rad), math.sin(angle_rad))
+
+        self._wheel_placements = {'natal': self._place_wheel_planets(natal_planets, angle_offset)}
+        if outer_planets:
+            self._wheel_placements['transits'] = self._place_wheel_planets(outer_planets, angle_offset)
+
+        # Aspects are resolved to drawable planet pairs once per chart, not per redraw.
+        # Pairs at the same longitude would only draw a zero-length line, so they are dropped.
+        self._aspect_pairs = {}
+        for aspect_info in aspects:
+            p1_name, aspect_name, p2_name = aspect_info['p1'], aspect_info['aspect'], aspect_info['p2']
+            drawable = p1_name in natal_planets and p2_name in natal_planets and aspect_name in self._ASPECT_COLORS
+            if drawable and natal_planets[p1_name][0] != natal_planets[p2_name][0]:
+                color_key = self._ASPECT_COLORS[aspect_name].rgba()
+                self._aspect_pairs.setdefault(color_key, []).append((p1_name, p2_name))
+
+        self._frame_dirty = True
         self.update()
 
+    def resizeEvent(self, event):
+        # The cached background and frame are drawn for one size only.
+        self._background = None
+        self._frame, self._frame_key = None, None
+        super().resizeEvent(event)
+
     def _setup_glyph_data(self):
         """
         Initializes all glyph and color data for rendering.
@@ -133,11 +230,8 @@ class ChartWidget(QFrame):
             'ASC': '\uE500', 'MC': '\uE501'
         }
 
-        # --- Neon Color Definitions ---
-        neon_pink = QColor("#FF01F9")   # Fire
-        neon_blue = QColor("#3DF6FF")   # Water
-        neon_yellow = QColor("#FFFF00") # Air
-        neon_green = QColor("#39FF14")  # Earth
+        neon_pink, neon_blue = self.NEON_PINK, self.NEON_BLUE
+        neon_yellow, neon_green = self.NEON_YELLOW, self.NEON_GREEN
 
         # CRITICAL: This mapping implements the user's requested color scheme.
         self.planet_colors = {
@@ -158,29 +252,29 @@ class ChartWidget(QFrame):
 
     def _draw_zodiac_glyphs(self, painter, center, ring, color, angle_offset):
         """Draws zodiac glyphs within a specified ring."""
-        font = QFont(self.astro_font_name, 35)
-        font.setStyleStrategy(QFont.StyleStrategy.NoFontMerging)
+        font = self.fonts['zodiac']
         # Place glyphs in the center of their designated ring
         placement_radius = (ring['inner'] + ring['outer']) / 2
+        # The sign midpoints are fixed; only the offset needs trig, once per ring.
+        offset_rad = math.radians(angle_offset)
+        cos_offset, sin_offset = math.cos(offset_rad), math.sin(offset_rad)
 
         for i, name in enumerate(self.zodiac_names):
             glyph = self.zodiac_glyphs[name]
-            angle_deg = (i * 30) + 15 + angle_offset
-            angle_rad = math.radians(angle_deg)
+            cos_mid, sin_mid = self._SIGN_MIDPOINTS[i]
 
-            x = center.x() + placement_radius * math.cos(angle_rad)
-            y = center.y() + placement_radius * math.sin(angle_rad)
+            # Rotate the midpoint by the offset (angle addition).
+            x = center.x() + placement_radius * (cos_mid * cos_offset - sin_mid * sin_offset)
+            y = center.y() + placement_radius * (sin_mid * cos_offset + cos_mid * sin_offset)
 
-            font_metrics = QFontMetrics(font)
-            text_width = font_metrics.horizontalAdvance(glyph)
-            text_height = font_metrics.height()
+            text_width, text_height = self._text_size(font, glyph)
 
             painter.save()
             painter.translate(x, y)
             painter.scale(1, -1)
             draw_point = QPointF(-text_width / 2, text_height / 4)
             glyph_color = self.zodiac_colors.get(name, color)
-            self._draw_glow_text(painter, draw_point, glyph, font, glyph_color)
+            self._draw_glow_glyph(painter, draw_point, glyph, font, glyph_color)
             painter.restore()
 
     def _calculate_dynamic_layout(self, wheels, width, height):
@@ -255,13 +349,27 @@ class ChartWidget(QFrame):
         if not self.natal_planets:
             return
 
+        # The whole chart is rendered off-screen and only redrawn when the data
+        # or the geometry changes; other repaints just blit the last frame.
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr)
+        if self._frame is None or self._frame_dirty or key != self._frame_key:
+            frame = QImage(int(self.width() * dpr), int(self.height() * dpr), QImage.Format.Format_ARGB32_Premultiplied)
+            frame.setDevicePixelRatio(dpr)
+            frame.fill(Qt.GlobalColor.transparent)
+            frame_painter = QPainter(frame)
+            self._draw_chart(frame_painter)
+            frame_painter.end()
+            self._frame, self._frame_key, self._frame_dirty = frame, key, False
+
+        # Only the part of the frame that was exposed needs copying; the
+        # source rect is in the image's device pixels.
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Invert the Y-axis for a standard Cartesian coordinate system (0,0 at bottom-left)
-        painter.translate(0, self.height())
-        painter.scale(1, -1)
+        target = QRectF(event.rect())
+        source = QRectF(target.x() * dpr, target.y() * dpr, target.width() * dpr, target.height() * dpr)
+        painter.drawImage(target, self._frame, source)
 
+    def _draw_chart(self, painter):
         center = QPointF(self.width() / 2, self.height() / 2)
         angle_offset = 180 - self.display_houses[0]
 
@@ -272,74 +380,103 @@ class ChartWidget(QFrame):
 
         layout = self._calculate_dynamic_layout(wheels_to_draw, self.width(), self.height())
 
-        # --- 2. Draw Chart Scaffolding (Structural Lines) ---
-        self._draw_chart_scaffolding(painter, center, layout, angle_offset)
+        # --- 2 & 3. Draw Chart Scaffolding and Zodiac Glyphs (cached) ---
+        painter.drawImage(QPointF(0, 0), self._background_image(center, layout, angle_offset))
+
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # --- 3. Draw Zodiac Glyphs ---
-        self._draw_zodiac_glyphs(painter, center, layout['zodiac_signs'], QColor("#3DF6FF"), angle_offset)
+        # Invert the Y-axis for a standard Cartesian coordinate system (0,0 at bottom-left)
+        painter.translate(0, self.height())
+        painter.scale(1, -1)
 
         # --- 4. Draw House Numbers ---
-        self._draw_house_numbers(painter, center, layout, QColor("#3DF6FF"), angle_offset)
+        self._draw_house_numbers(painter, center, layout, self.NEON_BLUE, angle_offset)
 
         # --- 4a. Draw House Cusp Labels ---
-        self._draw_house_cusp_labels(painter, center, layout, QColor("#3DF6FF"), angle_offset)
+        self._draw_house_cusp_labels(painter, center, layout, self.NEON_BLUE, angle_offset)
 
         # --- 5. Draw Planets for Each Wheel ---
         for wheel in wheels_to_draw:
             if wheel['name'] in layout:
-                self._draw_wheel_planets(painter, center, wheel, layout[wheel['name']], angle_offset)
+                self._draw_wheel_planets(painter, center, self._wheel_placements.get(wheel['name']), layout[wheel['name']])
 
         # --- 6. Draw Aspect Lines ---
-        self._draw_aspects(painter, center, layout['aspect_grid']['radius'], angle_offset)
+        self._draw_aspects(painter, center, layout['aspect_grid']['radius'])
+
+    def _background_image(self, center, layout, angle_offset):
+        """
+        Returns the chart scaffolding and zodiac glyphs, rendered off-screen.
+        They only change with the widget size, the houses and the set of wheels,
+        so the image is reused until one of those changes.
+        """
+        dpr = self.devicePixelRatioF()
+        wheel_names = tuple(name for name in ('natal', 'transits', 'progressions') if name in layout)
+        key = (self.width(), self.height(), dpr, tuple(self.display_houses[:12]), wheel_names)
+        if self._background is None or key != self._background_key:
+            background = QImage(int(self.width() * dpr), int(self.height() * dpr), QImage.Format.Format_ARGB32_Premultiplied)
+            background.setDevicePixelRatio(dpr)
+            background.fill(Qt.GlobalColor.transparent)
+            background_painter = QPainter(background)
+            background_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            background_painter.translate(0, self.height())
+            background_painter.scale(1, -1)
+            self._draw_chart_scaffolding(background_painter, center, layout, angle_offset)
+            self._draw_zodiac_glyphs(background_painter, center, layout['zodiac_signs'], self.NEON_BLUE, angle_offset)
+            background_painter.end()
+            self._background, self._background_key = background, key
+        return self._background
 
     def _format_degree_text(self, degree):
         """Formats a decimal degree into a string with degree, sign, and minute."""
-        zodiac_signs = ['Ari', 'Tau', 'Gem', 'Can', 'Leo', 'Vir', 'Lib', 'Sco', 'Sag', 'Cap', 'Aqu', 'Pis']
-        sign_index = int(degree / 30)
-        sign_name = zodiac_signs[sign_index]
-        deg_in_sign = int(degree % 30)
-        minutes = int((degree % 1) * 60)
-        return f"{deg_in_sign}° {sign_name} {minutes:02d}'"
+        return format_longitude(degree, pad_minutes=True)
 
     def _draw_chart_scaffolding(self, painter, center, layout, angle_offset):
         """Draws the primary circles and lines for the chart structure."""
-        line_color = QColor("#A372FF")
+        line_color = self.LINE_COLOR
 
-        # Draw outer zodiac circle, inner zodiac circle, and house number circle
+        # Draw outer zodiac circle, then the thinner circles together in one path:
+        # inner zodiac circle, house number circle and the circle for each dynamic wheel
         path = QPainterPath(); path.addEllipse(center, layout['zodiac_signs']['outer'], layout['zodiac_signs']['outer']); self._draw_glow_path(painter, path, line_color, 2)
-        path = QPainterPath(); path.addEllipse(center, layout['zodiac_signs']['inner'], layout['zodiac_signs']['inner']); self._draw_glow_path(painter, path, line_color, 1)
-        path = QPainterPath(); path.addEllipse(center, layout['house_numbers_ring']['outer'], layout['house_numbers_ring']['outer']); self._draw_glow_path(painter, path, line_color, 1)
-
-        # Draw the circles for each dynamic wheel that has been calculated
+        radii = [layout['zodiac_signs']['inner'], layout['house_numbers_ring']['outer']]
         for wheel_name in ['natal', 'transits', 'progressions']: # Add other wheel types if needed
             if wheel_name in layout:
-                wheel_outer_radius = layout[wheel_name]['outer']
-                path = QPainterPath(); path.addEllipse(center, wheel_outer_radius, wheel_outer_radius); self._draw_glow_path(painter, path, line_color, 1)
-
-        # Draw house cusp lines
+                radii.append(layout[wheel_name]['outer'])
+        path = QPainterPath()
+        # The outermost wheel shares the inner zodiac circle, which only needs drawing once.
+        for radius in dict.fromkeys(radii):
+            path.addEllipse(center, radius, radius)
+        self._draw_glow_path(painter, path, line_color, 1)
+
+        # Draw house cusp lines, batched into one path for the axes and one for the rest
+        axis_path, cusp_path = QPainterPath(), QPainterPath()
+        center_x, center_y = center.x(), center.y()
+        start_radius, end_radius = layout['house_numbers_ring']['outer'], layout['zodiac_signs']['inner']
         for i, cusp_degree in enumerate(self.display_houses[:12]):
             angle_rad = math.radians(cusp_degree + angle_offset)
+            cos_angle, sin_angle = math.cos(angle_rad), math.sin(angle_rad)
             is_axis = i in [0, 3, 6, 9] # ASC, IC, DSC, MC
 
-            x_start = center.x() + layout['house_numbers_ring']['outer'] * math.cos(angle_rad)
-            y_start = center.y() + layout['house_numbers_ring']['outer'] * math.sin(angle_rad)
-            x_end = center.x() + layout['zodiac_signs']['inner'] * math.cos(angle_rad)
-            y_end = center.y() + layout['zodiac_signs']['inner'] * math.sin(angle_rad)
-
-            cusp_path = QPainterPath(); cusp_path.moveTo(x_start, y_start); cusp_path.lineTo(x_end, y_end)
-            self._draw_glow_path(painter, cusp_path, line_color, 3 if is_axis else 1)
+            x_start = center_x + start_radius * cos_angle
+            y_start = center_y + start_radius * sin_angle
+            x_end = center_x + end_radius * cos_angle
+            y_end = center_y + end_radius * sin_angle
 
-    def _draw_wheel_planets(self, painter, center, wheel_data, ring, angle_offset):
-        """Draws planets for a single wheel using the definitive layout algorithm."""
-        glyph_font = QFont(self.astro_font_name, 24)
-        glyph_font.setStyleStrategy(QFont.StyleStrategy.NoFontMerging)
-        text_font = QFont("Titillium Web", 11)
-        font_color = QColor("#E0D2FF")
+            path = axis_path if is_axis else cusp_path
+            path.moveTo(x_start, y_start); path.lineTo(x_end, y_end)
+        self._draw_glow_path(painter, axis_path, line_color, 3)
+        self._draw_glow_path(painter, cusp_path, line_color, 1)
 
+    def _place_wheel_planets(self, planets, angle_offset):
+        """
+        Works out where a wheel's planets go using the definitive layout algorithm.
+        Returns one (glyph, label, cos, sin, rotation) tuple per planet, giving the
+        direction from the chart center and the label's rotation in degrees.
+        This only depends on the chart data, so it is done once per data change.
+        """
         # --- 1. Clustering Logic ---
         CLUSTER_THRESHOLD = 8 # Degrees
         planets_list = []
-        for name, (degree, speed) in wheel_data['planets'].items():
+        for name, (degree, speed) in planets.items():
             if name in self.planet_glyphs:
                 planets_list.append({
                     'name': name,
@@ -362,7 +499,8 @@ class ChartWidget(QFrame):
                     current_cluster = [planets_list[i]]
             clusters.append(current_cluster)
 
-        # --- 2. New Layout and Drawing Logic ---
+        # --- 2. New Layout Logic ---
+        placements = []
         for cluster in clusters:
             num_in_cluster = len(cluster)
             for i, planet in enumerate(cluster):
@@ -377,35 +515,7 @@ class ChartWidget(QFrame):
                 display_deg = planet['deg'] + angular_offset_nudge
                 angle_rad = math.radians(display_deg + angle_offset)
 
-                # --- Radial Positioning (glyph out, text in) ---
-                # These are based on the user's test script for relative positioning
-                glyph_radius = ring['outer'] - ( (ring['outer'] - ring['inner']) * 0.25 )
-                text_radius = glyph_radius - ( (ring['outer'] - ring['inner']) * 0.40 )
-
-                # --- Draw the Glyph ---
-                fm_glyph = QFontMetrics(glyph_font)
-                glyph_width = fm_glyph.horizontalAdvance(planet['glyph'])
-                glyph_height = fm_glyph.height()
-                glyph_x = center.x() + glyph_radius * math.cos(angle_rad)
-                glyph_y = center.y() + glyph_radius * math.sin(angle_rad)
-
-                painter.save()
-                painter.translate(glyph_x, glyph_y)
-                painter.scale(1, -1) # Flip text right-side up
-                self._draw_glow_text(painter, QPointF(-glyph_width / 2, glyph_height / 4), planet['glyph'], glyph_font, font_color)
-                painter.restore()
-
                 # --- THE DEFINITIVE ROTATION ALGORITHM ---
-                fm_text = QFontMetrics(text_font)
-                text_width = fm_text.horizontalAdvance(planet['label'])
-                text_height = fm_text.height()
-                text_x = center.x() + text_radius * math.cos(angle_rad)
-                text_y = center.y() + text_radius * math.sin(angle_rad)
-
-                painter.save()
-                painter.translate(text_x, text_y)
-                painter.scale(1, -1) # Flip text right-side up
-
                 # The rotation is the angle of the text's position, adjusted to be radial
                 rotation = display_deg + angle_offset
 
@@ -413,17 +523,62 @@ class ChartWidget(QFrame):
                 if 90 < (display_deg + angle_offset) % 360 < 270:
                     rotation += 180
 
-                painter.rotate(-rotation)
+                # The glyph and its label share the same direction from the center.
+                placements.append((planet['glyph'], planet['label'], math.cos(angle_rad), math.sin(angle_rad), rotation))
+        return placements
+
+    def _draw_wheel_planets(self, painter, center, placements, ring):
+        """Draws a wheel's planets at the places found by _place_wheel_planets."""
+        if not placements: return # Nothing on this wheel has a glyph
+
+        glyph_font = self.fonts['planet_glyph']
+        text_font = self.fonts['planet_label']
+        font_color = self.LABEL_COLOR
+
+        fm_text = QFontMetrics(text_font)
+        text_height = fm_text.height()
+        # Each glyph and label gets its own transform built from this one,
+        # rather than saving and restoring the whole painter state.
+        base_transform = painter.transform()
+
+        # --- Radial Positioning (glyph out, text in) ---
+        # These are based on the user's test script for relative positioning
+        glyph_radius = ring['outer'] - ( (ring['outer'] - ring['inner']) * 0.25 )
+        text_radius = glyph_radius - ( (ring['outer'] - ring['inner']) * 0.40 )
+
+        for glyph, label, cos_angle, sin_angle, rotation in placements:
+            # --- Draw the Glyph ---
+            glyph_width, glyph_height = self._text_size(glyph_font, glyph)
+            glyph_x = center.x() + glyph_radius * cos_angle
+            glyph_y = center.y() + glyph_radius * sin_angle
+
+            glyph_transform = QTransform(base_transform)
+            glyph_transform.translate(glyph_x, glyph_y)
+            glyph_transform.scale(1, -1) # Flip text right-side up
+            painter.setTransform(glyph_transform)
+            self._draw_glow_glyph(painter, QPointF(-glyph_width / 2, glyph_height / 4), glyph, glyph_font, font_color)
+
+            # --- Draw the Label ---
+            text_width = fm_text.horizontalAdvance(label)
+            text_x = center.x() + text_radius * cos_angle
+            text_y = center.y() + text_radius * sin_angle
+
+            label_transform = QTransform(base_transform)
+            label_transform.translate(text_x, text_y)
+            label_transform.scale(1, -1) # Flip text right-side up
+            label_transform.rotate(-rotation)
+            painter.setTransform(label_transform)
+
+            # Anchor the text so it rotates around its center
+            draw_point = QPointF(-text_width / 2, text_height / 4)
+            self._draw_glow_text(painter, draw_point, label, text_font, font_color)
 
-                # Anchor the text so it rotates around its center
-                draw_point = QPointF(-text_width / 2, text_height / 4)
-                self._draw_glow_text(painter, draw_point, planet['label'], text_font, font_color)
-                painter.restore()
+        painter.setTransform(base_transform)
 
     def _draw_house_numbers(self, painter, center, layout, color, angle_offset):
         """Draws the house numbers centered within their dedicated ring."""
         if not self.display_houses: return
-        house_font = QFont("Titillium Web", 14)
+        house_font = self.fonts['house_number']
         placement_radius = layout['house_numbers_text']['radius']
 
         for i in range(12):
@@ -442,18 +597,15 @@ class ChartWidget(QFrame):
             painter.translate(x, y)
             painter.scale(1, -1)
 
-            font_metrics = QFontMetrics(house_font)
-            text_width = font_metrics.horizontalAdvance(text)
-            text_height = font_metrics.height()
-
-            self._draw_glow_text(painter, QPointF(-text_width / 2, text_height / 4), text, house_font, color)
+            text_width, text_height = self._text_size(house_font, text)
+            self._draw_glow_glyph(painter, QPointF(-text_width / 2, text_height / 4), text, house_font, color)
             painter.restore()
 
     def _draw_house_cusp_labels(self, painter, center, layout, color, angle_offset):
         """Draws the house cusp degree labels outside the zodiac, with overlap prevention."""
         if not self.display_houses: return
-        text_font = QFont("Titillium Web", 10)
-        font_color = QColor("#E0D2FF")
+        text_font = self.fonts['cusp_label']
+        font_color = self.LABEL_COLOR
         placement_radius = layout['zodiac_signs']['outer'] + 10 # Just outside the zodiac ring
 
         # 1. Prepare cusp data
@@ -480,6 +632,9 @@ class ChartWidget(QFrame):
             clusters.append(current_cluster)
 
         # 3. Drawing with spreading
+        fm_text = QFontMetrics(text_font)
+        text_height = fm_text.height()
+        base_transform = painter.transform()
         for cluster in clusters:
             num_in_cluster = len(cluster)
             for i, cusp in enumerate(cluster):
@@ -493,48 +648,52 @@ class ChartWidget(QFrame):
                 display_deg = cusp['deg'] + angular_offset_nudge
                 angle_rad = math.radians(display_deg + angle_offset)
 
-                fm_text = QFontMetrics(text_font)
                 text_width = fm_text.horizontalAdvance(cusp['label'])
-                text_height = fm_text.height()
-
                 text_x = center.x() + placement_radius * math.cos(angle_rad)
                 text_y = center.y() + placement_radius * math.sin(angle_rad)
 
-                painter.save()
-                painter.translate(text_x, text_y)
-                painter.scale(1, -1)
+                label_transform = QTransform(base_transform)
+                label_transform.translate(text_x, text_y)
+                label_transform.scale(1, -1)
 
                 rotation = display_deg + angle_offset
                 if 90 < (display_deg + angle_offset) % 360 < 270:
                     rotation += 180
 
-                painter.rotate(-rotation)
+                label_transform.rotate(-rotation)
+                painter.setTransform(label_transform)
                 draw_point = QPointF(-text_width / 2, text_height / 4)
                 self._draw_glow_text(painter, draw_point, cusp['label'], text_font, font_color)
-                painter.restore()
 
-    def _draw_aspects(self, painter, center, radius, angle_offset):
+        painter.setTransform(base_transform)
+
+    def _text_size(self, font, text):
+        """Returns the (width, height) of a fixed glyph or number, measured once per font."""
+        key = (font.key(), text)
+        size = self._text_sizes.get(key)
+        if size is None:
+            metrics = QFontMetrics(font)
+            size = self._text_sizes[key] = (metrics.horizontalAdvance(text), metrics.height())
+        return size
+
+    def _draw_aspects(self, painter, center, radius):
         """Draws the aspect lines in the center of the chart."""
-        aspect_colors = {
-            'Trine': QColor(61, 246, 255, 150), 'Sextile': QColor(61, 246, 255, 150),
-            'Square': QColor(255, 1, 249, 150), 'Opposition': QColor(255, 1, 249, 150),
-            'Conjunction': QColor(200, 200, 200, 150)
+        if not self._aspect_pairs: return
+        # Each planet's end point is found once, however many aspects it makes.
+        points = {
+            name: QPointF(center.x() + radius * cos_angle, center.y() + radius * sin_angle)
+            for name, (cos_angle, sin_angle) in self._planet_directions.items()
         }
-        for aspect_info in self.aspects:
-            p1_name, aspect_name, p2_name = aspect_info['p1'], aspect_info['aspect'], aspect_info['p2']
-            if p1_name in self.natal_planets and p2_name in self.natal_planets:
-                p1_pos, p2_pos = self.natal_planets[p1_name][0], self.natal_planets[p2_name][0]
-                color = aspect_colors.get(aspect_name)
-                if color:
-                    pen = QPen(color, 1.5, Qt.PenStyle.SolidLine)
-                    painter.setPen(pen)
-                    p1_rad = math.radians(p1_pos + angle_offset)
-                    p1_x = center.x() + radius * math.cos(p1_rad)
-                    p1_y = center.y() + radius * math.sin(p1_rad)
-                    p2_rad = math.radians(p2_pos + angle_offset)
-                    p2_x = center.x() + radius * math.cos(p2_rad)
-                    p2_y = center.y() + radius * math.sin(p2_rad)
-                    painter.drawLine(QPointF(p1_x, p1_y), QPointF(p2_x, p2_y))
+
+        # Lines are collected into one path per color and stroked together.
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        for color_key, pairs in self._aspect_pairs.items():
+            path = QPainterPath()
+            for p1_name, p2_name in pairs:
+                path.moveTo(points[p1_name])
+                path.lineTo(points[p2_name])
+            painter.setPen(self._aspect_pens[color_key])
+            painter.drawPath(path)
 
     def _draw_glow_path(self, painter, path, color, width):
         """
@@ -543,53 +702,69 @@ class ChartWidget(QFrame):
         The 'color' parameter is expected to be QColor("#3DF6FF").
         """
         # The base color is #3DF6FF, which is rgba(61, 246, 255).
+        # One pen is reused for every pass; only its color and width change.
+        pen = self._glow_pen
 
         # CSS: drop-shadow(0 0 20px rgba(61, 246, 255, 0.4));
-        glow_color_1 = QColor(61, 246, 255, int(255 * 0.4))
-        pen1 = QPen(glow_color_1, width * 3, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
-        painter.setPen(pen1)
+        pen.setColor(self._GLOW_COLORS[0])
+        pen.setWidthF(width * 3)
+        painter.setPen(pen)
         painter.drawPath(path)
 
         # CSS: drop-shadow(0 0 12px rgba(61, 246, 255, 0.7));
-        glow_color_2 = QColor(61, 246, 255, int(255 * 0.7))
-        pen2 = QPen(glow_color_2, width * 2, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
-        painter.setPen(pen2)
+        pen.setColor(self._GLOW_COLORS[1])
+        pen.setWidthF(width * 2)
+        painter.setPen(pen)
         painter.drawPath(path)
 
         # CSS: drop-shadow(0 0 6px var(--neon-blue));
-        pen3 = QPen(color, width * 1.5, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
-        painter.setPen(pen3)
+        pen.setColor(color)
+        pen.setWidthF(width * 1.5)
+        painter.setPen(pen)
         painter.drawPath(path)
 
         # CSS: drop-shadow(0 0 2px var(--neon-blue));
-        pen4 = QPen(color, width * 0.5, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
-        painter.setPen(pen4)
+        pen.setWidthF(width * 0.5)
+        painter.setPen(pen)
         painter.drawPath(path)
 
         # Core line (stroke: var(--neon-blue); stroke-width: 4;)
-        pen_core = QPen(color, width, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
-        painter.setPen(pen_core)
+        pen.setWidthF(width)
+        painter.setPen(pen)
         painter.drawPath(path)
 
+    def _draw_glow_glyph(self, painter, point, text, font, color):
+        """
+        Same as _draw_glow_text, for glyphs from a fixed set (signs, planets, house
+        numbers). Each one is rendered once per font, color and device pixel ratio,
+        then blitted. Degree labels vary from chart to chart and are drawn directly.
+        """
+        dpr = self.devicePixelRatioF()
+        key = (text, font.key(), color.rgba(), dpr)
+        sprite = self._glyph_sprites.get(key)
+        if sprite is None:
+            # Two pixels of slack on each side keep antialiased edges inside the sprite.
+            rect = QFontMetrics(font).boundingRect(text).adjusted(-2, -2, 2, 2)
+            image = QImage(math.ceil(rect.width() * dpr), math.ceil(rect.height() * dpr), QImage.Format.Format_ARGB32_Premultiplied)
+            image.setDevicePixelRatio(dpr)
+            image.fill(Qt.GlobalColor.transparent)
+            sprite_painter = QPainter(image)
+            sprite_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            # The bounding rect is relative to the baseline origin.
+            self._draw_glow_text(sprite_painter, QPointF(-rect.left(), -rect.top()), text, font, color)
+            sprite_painter.end()
+            sprite = self._glyph_sprites[key] = (image, rect.left(), rect.top())
+
+        image, left, top = sprite
+        painter.drawImage(QPointF(point.x() + left, point.y() + top), image)
+
     def _draw_glow_text(self, painter, point, text, font, color):
-        """A helper function to draw text with a more realistic, multi-layered neon glow."""
+        """
+        Draws text in its neon color. QPainter fills text glyphs and ignores the
+        pen width, so wider translucent "glow" passes would only land under the
+        opaque core text; a single pass gives the same result.
+        """
         painter.setFont(font)
-
-        # 1. Outer Glow: Soft and wide
-        glow_color1 = QColor(color)
-        glow_color1.setAlpha(40) # Reduced alpha for subtlety
-        pen1 = QPen(glow_color1, 7, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
-        painter.setPen(pen1)
-        painter.drawText(point, text)
-
-        # 2. Inner Glow: Tighter and brighter
-        glow_color2 = QColor(color)
-        glow_color2.setAlpha(80) # Reduced alpha
-        pen2 = QPen(glow_color2, 4, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
-        painter.setPen(pen2)
-        painter.drawText(point, text)
-
-        # 3. Core Text: Use the actual neon color, not a lightened version
-        pen3 = QPen(color, 1, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
-        painter.setPen(pen3)
+        self._text_pen.setColor(color)
+        painter.setPen(self._text_pen)
         painter.drawText(point, text)
\ No newline at end of file